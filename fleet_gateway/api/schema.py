@@ -5,7 +5,9 @@ This module combines all GraphQL components (queries, mutations, subscriptions)
 into a single Strawberry schema for use with FastAPI.
 """
 from __future__ import annotations
+from functools import partial
 import strawberry
+from strawberry.extensions import ParserCache, QueryDepthLimiter, ValidationCache
 from uuid import UUID
 
 from fleet_gateway.api.types import Robot, RobotCell, Job, Request, JobOrderInput, JobOrderResult, RequestOrderInput, RequestOrderResult, WarehouseOrderInput, WarehouseOrderResult, RobotCellInput
@@ -104,8 +106,20 @@ class Mutation:
         fleet_handler: FleetHandler = info.context["fleet_handler"]
         return await fleet_handler.free_cell(robot_cell)
 
-# Create the combined GraphQL schema
+# Job <-> Request and RobotCell -> Job links are cyclic; the deepest real query
+# (robot -> cells -> holding -> request -> pickup -> target_node -> field) stays within this
+MAX_QUERY_DEPTH = 8
+
+# Dashboards poll the same few documents, so parse and validation results are reused per distinct query string
+DOCUMENT_CACHE_SIZE = 256
+
+# Create the combined GraphQL schema; over-deep documents are rejected during validation, before any resolver runs
 schema = strawberry.Schema(
     query=Query,
     mutation=Mutation,
+    extensions=[
+        partial(QueryDepthLimiter, max_depth=MAX_QUERY_DEPTH),
+        partial(ParserCache, maxsize=DOCUMENT_CACHE_SIZE),
+        partial(ValidationCache, maxsize=DOCUMENT_CACHE_SIZE),
+    ],
 )
@@ -10,10 +10,12 @@ from uuid import UUID
 from datetime import datetime
 from typing import TYPE_CHECKING
 
+from strawberry.dataloader import DataLoader
+
 from fleet_gateway import enums
+from fleet_gateway.helpers.request_status import derive_request_status
 
 if TYPE_CHECKING:
-    from fleet_gateway.order_store import OrderStore
     from fleet_gateway.fleet_handler import FleetHandler
 
 NodeType = strawberry.enum(enums.NodeType)
@@ -27,6 +29,7 @@ OrderStatus = strawberry.enum(enums.OrderStatus)
 @strawberry.type
 class Node:
     """Warehouse path network node"""
+    __slots__ = ("id", "alias", "tag_id", "x", "y", "height", "node_type")
     id: int
     alias: str | None
     tag_id: str | None
@@ -38,29 +41,32 @@ class Node:
 @strawberry.type
 class Request:
     """Warehouse request (pickup + delivery pair)"""
+    __slots__ = ("uuid", "pickup_uuid", "delivery_uuid", "handling_robot_name")
     uuid: UUID
     # Private variables
     pickup_uuid: strawberry.Private[UUID]
     delivery_uuid: strawberry.Private[UUID]
     handling_robot_name: strawberry.Private[str]
 
+    # Job reads go through the per-request job_loader, so sibling requests share one pipelined fetch
     @strawberry.field
     async def status(self, info: strawberry.types.Info) -> OrderStatus:
-        order_store: OrderStore = info.context["order_store"]
-        return await order_store.get_request_status(self)
+        job_loader: DataLoader[UUID, Job | None] = info.context["job_loader"]
+        pickup_job, delivery_job = await job_loader.load_many([self.pickup_uuid, self.delivery_uuid])
+        return derive_request_status(pickup_job, delivery_job)
 
     @strawberry.field
     async def pickup(self, info: strawberry.types.Info) -> Job:
-        order_store: OrderStore = info.context["order_store"]
-        job = await order_store.get_job(self.pickup_uuid)
+        job_loader: DataLoader[UUID, Job | None] = info.context["job_loader"]
+        job = await job_loader.load(self.pickup_uuid)
         if job is None:
             raise ValueError(f"Pickup job {self.pickup_uuid} not found in order_store")
         return job
 
     @strawberry.field
     async def delivery(self, info: strawberry.types.Info) -> Job:
-        order_store: OrderStore = info.context["order_store"]
-        job = await order_store.get_job(self.delivery_uuid)
+        job_loader: DataLoader[UUID, Job | None] = info.context["job_loader"]
+        job = await job_loader.load(self.delivery_uuid)
         if job is None:
             raise ValueError(f"Delivery job {self.delivery_uuid} not found in order_store")
         return job
@@ -77,6 +83,7 @@ class Request:
 class Job:
     """Robot job with operation type and path nodes"""
     """Path resolved at job time"""
+    __slots__ = ("uuid", "status", "operation", "target_node", "request_uuid", "handling_robot_name")
     uuid: UUID
     status: OrderStatus
     operation: JobOperation
@@ -89,8 +96,8 @@ class Job:
     async def request(self, info: strawberry.types.Info) -> Request | None:
         if self.request_uuid is None:
             return None
-        order_store: OrderStore = info.context["order_store"]
-        return await order_store.get_request(self.request_uuid)
+        request_loader: DataLoader[UUID, Request | None] = info.context["request_loader"]
+        return await request_loader.load(self.request_uuid)
 
     @strawberry.field
     async def handling_robot(self, info: strawberry.types.Info) -> Robot:
@@ -166,8 +173,8 @@ class RobotCell:
     async def holding(self, info: strawberry.types.Info) -> Job | None:
         if self.holding_uuid is None:
             return None
-        order_store: OrderStore = info.context["order_store"]
-        return await order_store.get_job(self.holding_uuid)
+        job_loader: DataLoader[UUID, Job | None] = info.context["job_loader"]
+        return await job_loader.load(self.holding_uuid)
 
 # Helper types
 @strawberry.input
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import asyncio
 from uuid import UUID
@@ -25,6 +25,15 @@ class FleetHandler():
             return
         self.handlers[robot_name].assign(job)
 
+    def assign_jobs(self, robot_name: str, jobs: Sequence[Job]):
+        if robot_name not in self.handlers or not jobs:
+            return
+        self.handlers[robot_name].assign_jobs(jobs)
+
+    def has_robot(self, name: str) -> bool:
+        """Existence check for validation paths; unlike get_robot it builds no Robot snapshot"""
+        return name in self.handlers
+
     # API for query
     def get_robot(self, name: str) -> Robot | None:
         if name not in self.handlers:
@@ -6,7 +6,7 @@ Converts Redis hash format back to Job and Request objects.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-import json
+import orjson
 from uuid import UUID
 
 from fleet_gateway.enums import NodeType, JobOperation, OrderStatus
@@ -14,6 +14,11 @@ from fleet_gateway.enums import NodeType, JobOperation, OrderStatus
 if TYPE_CHECKING:
     from fleet_gateway.api.types import Node, Request, Job
 
+# Stored enum value -> member
+_NODE_TYPE_BY_VALUE: dict[int, NodeType] = {member.value: member for member in NodeType}
+_JOB_OPERATION_BY_VALUE: dict[int, JobOperation] = {member.value: member for member in JobOperation}
+_ORDER_STATUS_BY_VALUE: dict[int, OrderStatus] = {member.value: member for member in OrderStatus}
+
 
 def dict_to_node(data: dict) -> Node | None:
     """Convert dict to Node object"""
@@ -25,7 +30,7 @@ def dict_to_node(data: dict) -> Node | None:
         x=float(data['x']),
         y=float(data['y']),
         height=float(data['height']),
-        node_type=NodeType(int(data['node_type']))
+        node_type=_NODE_TYPE_BY_VALUE[int(data['node_type'])]
     )
 
 
@@ -50,9 +55,9 @@ def dict_to_job(uuid: UUID, data: dict) -> Job | None:
     from fleet_gateway.api.types import Job
     return Job(
         uuid=uuid,
-        status=OrderStatus(int(data['status'])),
-        operation=JobOperation(int(data['operation'])),
-        target_node=dict_to_node(json.loads(data['target_node'])),
+        status=_ORDER_STATUS_BY_VALUE[int(data['status'])],
+        operation=_JOB_OPERATION_BY_VALUE[int(data['operation'])],
+        target_node=dict_to_node(orjson.loads(data['target_node'])),
         request_uuid=UUID(data['request']) if data.get('request') else None,
         handling_robot_name=data['handling_robot']
     )
\ No newline at end of file
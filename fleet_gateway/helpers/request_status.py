@@ -0,0 +1,45 @@
+"""
+Request status derivation.
+
+A request has no stored status; it is derived from its pickup and delivery jobs.
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from fleet_gateway.enums import OrderStatus
+
+if TYPE_CHECKING:
+    from fleet_gateway.api.types import Job
+
+
+def _combine_job_statuses(pickup_status: OrderStatus, delivery_status: OrderStatus) -> OrderStatus:
+    # 1. Terminal failure states take highest priority
+    if pickup_status == OrderStatus.FAILED or delivery_status == OrderStatus.FAILED:
+        return OrderStatus.FAILED
+
+    if pickup_status == OrderStatus.CANCELED or delivery_status == OrderStatus.CANCELED:
+        return OrderStatus.CANCELED
+
+    # 2. If both completed -> request completed
+    if pickup_status == OrderStatus.COMPLETED and delivery_status == OrderStatus.COMPLETED:
+        return OrderStatus.COMPLETED
+
+    # 3. If either is currently running -> request in progress
+    if pickup_status == OrderStatus.IN_PROGRESS or delivery_status == OrderStatus.IN_PROGRESS:
+        return OrderStatus.IN_PROGRESS
+
+    # 4. Otherwise still waiting
+    return OrderStatus.QUEUING
+
+# (pickup status, delivery status) -> request status
+_REQUEST_STATUS_BY_JOB_STATUSES: dict[tuple[OrderStatus, OrderStatus], OrderStatus] = {
+    (pickup_status, delivery_status): _combine_job_statuses(pickup_status, delivery_status)
+    for pickup_status in OrderStatus
+    for delivery_status in OrderStatus
+}
+
+def derive_request_status(pickup_job: Job | None, delivery_job: Job | None) -> OrderStatus:
+    """Request status derived from its pickup and delivery jobs"""
+    if pickup_job is None or delivery_job is None:
+        raise RuntimeError("pickup_job or delivery_job not existed")
+    return _REQUEST_STATUS_BY_JOB_STATUSES[(pickup_job.status, delivery_job.status)]
@@ -5,7 +5,7 @@ Converts Job and Request objects to/from Redis hash format.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
-import json
+import orjson
 
 if TYPE_CHECKING:
     from fleet_gateway.api.types import Node, Request, Job
@@ -37,7 +37,7 @@ def job_to_dict(job: Job) -> dict:
         # 'uuid': str(job.uuid),
         'status': job.status.value,
         'operation': job.operation.value,
-        'target_node': json.dumps(node_to_dict(job.target_node)),
+        'target_node': orjson.dumps(node_to_dict(job.target_node)).decode(),
         'request': str(job.request_uuid) if job.request_uuid else "",
         'handling_robot': job.handling_robot_name
     }
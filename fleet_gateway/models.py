@@ -17,7 +17,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Pose:
     timestamp: datetime
     x: float
@@ -25,19 +25,19 @@ class Pose:
     a: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     timestamp: datetime
     qr_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MobileBaseState:
     tag: Tag | None
     pose: Pose | None
 
 
-@dataclass
+@dataclass(slots=True)
 class PiggybackState:
     timestamp: datetime
     lift: float
@@ -47,7 +47,7 @@ class PiggybackState:
     hook_right: float
 
 
-@dataclass
+@dataclass(slots=True)
 class RobotCell:
     height: float
     holding_uuid: UUID | None = None
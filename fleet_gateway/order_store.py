@@ -4,7 +4,8 @@ Order Store - Centralized Job & Request management and persistence.
 Handles all request CRUD operations, persistence to Redis, and request lifecycle management.
 """
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
+import asyncio
 
 import redis.asyncio as redis
 from uuid import UUID
@@ -18,6 +19,10 @@ from fleet_gateway.helpers.deserializers import dict_to_request, dict_to_job
 if TYPE_CHECKING:
     from fleet_gateway.api.types import Request, Job
 
+# Keys fetched per SCAN step when listing every request or job
+_SCAN_COUNT = 500
+
+
 class OrderStore():
     def __init__(self, redis_client: redis.Redis):
         """Initialize OrderStore with Redis client"""
@@ -31,42 +36,11 @@ class OrderStore():
             logger.error("Failed to store request {}: {}", request.uuid, e)
             return False
     
-    async def get_request_status(self, request: Request) -> OrderStatus:
-        pickup_job: Job = await self.get_job(request.pickup_uuid)
-        delivery_job: Job = await self.get_job(request.delivery_uuid)
-        if pickup_job is None or delivery_job is None:
-            raise RuntimeError("pickup_job or delivery_job not existed")
-        
-        pickup_status = pickup_job.status
-        delivery_status = delivery_job.status
-
-        # 1. Terminal failure states take highest priority
-        if pickup_status == OrderStatus.FAILED or delivery_status == OrderStatus.FAILED:
-            return OrderStatus.FAILED
-
-        if pickup_status == OrderStatus.CANCELED or delivery_status == OrderStatus.CANCELED:
-            return OrderStatus.CANCELED
-
-        # 2. If both completed -> request completed
-        if pickup_status == OrderStatus.COMPLETED and delivery_status == OrderStatus.COMPLETED:
-            return OrderStatus.COMPLETED
-
-        # 3. If either is currently running -> request in progress
-        if pickup_status == OrderStatus.IN_PROGRESS or delivery_status == OrderStatus.IN_PROGRESS:
-            return OrderStatus.IN_PROGRESS
-
-        # 4. Otherwise still waiting
-        return OrderStatus.QUEUING
-
     async def get_request(self, uuid: UUID) -> Request | None:
         return dict_to_request(uuid, await self.redis.hgetall(f"request:{str(uuid)}"))
     
     async def get_requests(self) -> list[Request]:
-        keys = [k async for k in self.redis.scan_iter(match="request:*")]
-        pipe = self.redis.pipeline()
-        for key in keys:
-            pipe.hgetall(key)
-        return [request for k, d in zip(keys, await pipe.execute()) if (request:=dict_to_request(UUID(k.split(":", 1)[1]), d)) is not None]
+        return [request for uuid, d in await self._scan_hashes("request") if (request:=dict_to_request(uuid, d)) is not None]
 
     async def set_job(self, job: Job) -> bool:
         try:
@@ -76,12 +50,84 @@ class OrderStore():
             logger.error("Failed to store job {}: {}", job.uuid, e)
             return False
 
+    async def set_jobs(self, jobs: list[Job]) -> list[bool]:
+        """Store many jobs in one pipelined round trip, returning per-job success"""
+        return await self._hset_pipelined([(f"job:{str(job.uuid)}", job_to_dict, job) for job in jobs])
+
+    async def set_jobs_and_requests(self, jobs: list[Job], requests: list[Request]) -> list[bool]:
+        """Store many jobs and requests in one pipelined round trip, returning per-job success followed by per-request"""
+        entries: list[tuple[str, Callable[[Any], dict], Job | Request]] = [(f"job:{str(job.uuid)}", job_to_dict, job) for job in jobs]
+        entries.extend((f"request:{str(request.uuid)}", request_to_dict, request) for request in requests)
+        return await self._hset_pipelined(entries)
+
+    async def _hset_pipelined(self, entries: list[tuple[str, Callable[[Any], dict], Job | Request]]) -> list[bool]:
+        # Each entry is serialized under its own guard, so one bad record fails alone instead of the whole batch
+        pipe = self.redis.pipeline(transaction=False)
+        queued: list[bool] = []
+        for key, to_dict, item in entries:
+            try:
+                pipe.hset(key, mapping=to_dict(item))
+                queued.append(True)
+            except Exception as e:
+                logger.error("Failed to serialize {}: {}", key, e)
+                queued.append(False)
+        try:
+            results = iter(await pipe.execute(raise_on_error=False))
+        except Exception as e:
+            logger.error("Failed to store {} entries: {}", len(entries), e)
+            return [False] * len(entries)
+        return [ok and not isinstance(next(results), Exception) for ok in queued]
+
+    async def get_jobs_by_uuids(self, uuids: list[UUID]) -> list[Job | None]:
+        """Read many jobs in one pipelined round trip, None where a job does not exist"""
+        pipe = self.redis.pipeline(transaction=False)
+        for uuid in uuids:
+            pipe.hgetall(f"job:{str(uuid)}")
+        return [dict_to_job(uuid, d) for uuid, d in zip(uuids, await pipe.execute())]
+
+    async def get_requests_by_uuids(self, uuids: list[UUID]) -> list[Request | None]:
+        """Read many requests in one pipelined round trip, None where a request does not exist"""
+        pipe = self.redis.pipeline(transaction=False)
+        for uuid in uuids:
+            pipe.hgetall(f"request:{str(uuid)}")
+        return [dict_to_request(uuid, d) for uuid, d in zip(uuids, await pipe.execute())]
+
     async def get_job(self, uuid: UUID) -> Job | None:
         return dict_to_job(uuid, await self.redis.hgetall(f"job:{str(uuid)}"))
 
     async def get_jobs(self) -> list[Job]:
-        keys = [k async for k in self.redis.scan_iter(match="job:*")]
-        pipe = self.redis.pipeline()
+        return [job for uuid, d in await self._scan_hashes("job") if (job:=dict_to_job(uuid, d)) is not None]
+
+    async def _scan_hashes(self, prefix: str) -> list[tuple[UUID, dict]]:
+        """Every {prefix}:{uuid} hash; each full batch of keys is read in a pipeline while the next is scanned, one read in flight at a time"""
+        seen: set[str] = set()
+        batch: list[str] = []
+        hashes: list[tuple[UUID, dict]] = []
+        read: asyncio.Future | None = None
+        try:
+            async for key in self.redis.scan_iter(match=f"{prefix}:*", count=_SCAN_COUNT):
+                # SCAN may return a key more than once
+                if key in seen:
+                    continue
+                seen.add(key)
+                batch.append(key)
+                if len(batch) >= _SCAN_COUNT:
+                    if read is not None:
+                        hashes.extend(await read)
+                    read = asyncio.ensure_future(self._read_hashes(batch))
+                    batch = []
+            if read is not None:
+                hashes.extend(await read)
+            if batch:
+                hashes.extend(await self._read_hashes(batch))
+        except BaseException:
+            if read is not None:
+                read.cancel()
+            raise
+        return hashes
+
+    async def _read_hashes(self, keys: list[str]) -> list[tuple[UUID, dict]]:
+        pipe = self.redis.pipeline(transaction=False)
         for key in keys:
             pipe.hgetall(key)
-        return [job for k, d in zip(keys, await pipe.execute()) if (job:=dict_to_job(UUID(k.split(":", 1)[1]), d)) is not None]
+        return [(UUID(key.split(":", 1)[1]), d) for key, d in zip(keys, await pipe.execute())]
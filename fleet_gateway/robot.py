@@ -5,17 +5,18 @@
 # threading.RLock around all state mutations or restructuring callbacks to dispatch back onto
 # the asyncio thread via loop.call_soon_threadsafe before touching shared state.
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Sequence
 
 import asyncio
 import math
+import random
 import threading
-import time
 from datetime import datetime, timezone, timedelta
 
 from fleet_gateway.route_oracle import RouteOracle
 from fleet_gateway.helpers.serializers import node_to_dict
 
+import orjson
 from roslibpy import ActionClient, Goal, GoalStatus, Ros, Topic
 
 from fleet_gateway.enums import OrderStatus, RobotConnectionStatus, RobotActionStatus, JobOperation, RobotCellLevel
@@ -24,6 +25,11 @@ from fleet_gateway.models import MobileBaseState, Pose, Tag, PiggybackState, Rob
 from loguru import logger
 
 _RECONNECT_INTERVAL = 5.0  # seconds between reconnect attempts
+_RECONNECT_MAX_INTERVAL = 60.0  # cap for the backoff after repeated failed attempts
+_RECONNECT_JITTER = 0.2  # +/- fraction applied to each wait so robots do not retry in lockstep
+_EVENT_LOOP_LOCK = threading.Lock()  # held by the first connection attempt while it starts roslibpy's reactor
+_EVENT_LOOP_STARTED = threading.Event()  # set once that attempt returns, after which attempts run in parallel
+_STATE_TZ = timezone(timedelta(hours=7))  # timezone of robot state timestamps
 
 if TYPE_CHECKING:
     from fleet_gateway.api.types import Robot, Job, Node
@@ -36,11 +42,8 @@ class RobotConnector(Ros):
     def __init__(self, name: str, host_ip: str, port: int, route_oracle: RouteOracle):
         super().__init__(host=host_ip, port=port)
         self._should_reconnect = True
-        try:
-            self.run(1.0)
-            logger.info("Robot {} initial connection succeeded", name)
-        except Exception as e:
-            logger.warning("Robot {} initial connection failed: {}. Will retry via reconnect loop.", name, e)
+        # Set on connection close or shutdown so the reconnect loop reacts without waiting out its interval
+        self._reconnect_wakeup = threading.Event()
 
         # Robot state (all operational state in one place)
         self.name = name
@@ -67,10 +70,11 @@ class RobotConnector(Ros):
         self.route_oracle: RouteOracle = route_oracle
 
         # Log connection events
-        self.on('connection', lambda: logger.info("Robot {} connected", self.name))
-        self.on('close', lambda: logger.warning("Robot {} connection closed", self.name))
+        self.on('connection', lambda *_: logger.info("Robot {} connected", self.name))
+        self.on('close', self._on_close)
 
-        # Start reconnect loop in a daemon thread (no Twisted imports needed)
+        # Start reconnect loop in a daemon thread (no Twisted imports needed); it also makes the
+        # initial connection, so robots connect in parallel and startup never blocks the event loop
         self._reconnect_thread = threading.Thread(
             target=self._reconnect_loop,
             name=f"reconnect-{name}",
@@ -87,21 +91,21 @@ class RobotConnector(Ros):
                 2.0 * (orientation['w'] * orientation['z'] + orientation['x'] * orientation['y']),
                 1.0 - 2.0 * (orientation['y'] ** 2 + orientation['z'] ** 2)
             )
-            self.mobile_base_state.pose = Pose(datetime.now(timezone(timedelta(hours=7))), position['x'], position['y'], a)
+            self.mobile_base_state.pose = Pose(datetime.now(_STATE_TZ), position['x'], position['y'], a)
 
     def qr_id_callback(self, message):
         """"Callback for QR"""
         if 'data' in message:
             if self.mobile_base_state.tag is None or self.mobile_base_state.tag.qr_id != message['data']:
                 logger.debug("Robot {} QR tag changed: {} -> {}", self.name, self.mobile_base_state.tag.qr_id if self.mobile_base_state.tag else None, message['data'])
-            self.mobile_base_state.tag = Tag(datetime.now(timezone(timedelta(hours=7))), message['data'])
+            self.mobile_base_state.tag = Tag(datetime.now(_STATE_TZ), message['data'])
 
     def piggyback_callback(self, message):
         """Callback for piggyback state updates"""
         if 'name' in message and 'position' in message:
             try:
                 self.piggyback_state = PiggybackState(
-                    datetime.now(timezone(timedelta(hours=7))),
+                    datetime.now(_STATE_TZ),
                     message["position"][message['name'].index('lift')],
                     message["position"][message['name'].index('turntable')],
                     message["position"][message['name'].index('slide')],
@@ -115,20 +119,54 @@ class RobotConnector(Ros):
     # Auto-reconnect                                                       #
     # ------------------------------------------------------------------ #
 
+    def _on_close(self, *_):
+        """roslibpy 'close' listener (called with the protocol); wakes the reconnect loop"""
+        logger.warning("Robot {} connection closed", self.name)
+        self._reconnect_wakeup.set()
+
+    def _connect(self):
+        """self.run(1.0), with the first caller across all robots starting roslibpy's shared event loop alone"""
+        # roslibpy starts its reactor without a guard, so concurrent first runs could start it twice;
+        # once any run has returned the reactor is up and the rest may wait for their robots together
+        if not _EVENT_LOOP_STARTED.is_set():
+            with _EVENT_LOOP_LOCK:
+                if not _EVENT_LOOP_STARTED.is_set():
+                    try:
+                        self.run(1.0)
+                    finally:
+                        _EVENT_LOOP_STARTED.set()
+                    return
+        self.run(1.0)
+
     def _reconnect_loop(self):
-        """Daemon thread: calls self.run(1.0) whenever the robot is not connected."""
+        """Daemon thread: connects immediately, then calls self.run(1.0) whenever the robot is not connected."""
+        try:
+            self._connect()
+            logger.info("Robot {} initial connection succeeded", self.name)
+        except Exception as e:
+            logger.warning("Robot {} initial connection failed: {}. Will retry via reconnect loop.", self.name, e)
+        # A close raised by the failed initial attempt must not trigger an immediate retry
+        self._reconnect_wakeup.clear()
+
+        interval = _RECONNECT_INTERVAL
         while self._should_reconnect:
-            time.sleep(_RECONNECT_INTERVAL)
+            self._reconnect_wakeup.wait(interval * random.uniform(1 - _RECONNECT_JITTER, 1 + _RECONNECT_JITTER))
+            self._reconnect_wakeup.clear()
             if self._should_reconnect and not self.is_connected:
                 logger.info("Robot {} not connected, attempting reconnect...", self.name)
                 try:
-                    self.run(1.0)
+                    self._connect()
                 except Exception as e:
                     logger.error("Robot {} reconnect error: {}", self.name, e)
+                # A close raised by a failed attempt must not trigger an immediate retry
+                self._reconnect_wakeup.clear()
+            # Back off exponentially while the robot stays unreachable; reset once it is back
+            interval = _RECONNECT_INTERVAL if self.is_connected else min(interval * 2, _RECONNECT_MAX_INTERVAL)
 
     def shutdown(self):
         """Stop reconnect loop and close the WebSocket connection."""
         self._should_reconnect = False
+        self._reconnect_wakeup.set()
         self.close()
 
     # ------------------------------------------------------------------ #
@@ -155,8 +193,9 @@ class RobotConnector(Ros):
             'operation': job.operation.value,
             'robot_cell': robot_cell.value
         }
-        import json
-        logger.debug("Robot {} sending goal:\n{}", self.name, json.dumps(goal_dict, indent=2))
+        # Pretty-printing the goal is only paid for when debug logging is actually emitted
+        logger.opt(lazy=True).debug("Robot {} sending goal:\n{}", lambda: self.name,
+                                    lambda: orjson.dumps(goal_dict, option=orjson.OPT_INDENT_2).decode())
         goal = Goal(goal_dict)
 
         # Send goal with callbacks
@@ -222,6 +261,12 @@ class RobotHandler(RobotConnector):
         logger.info("Robot {} job queued: {} (queue size: {})", self.name, job.uuid, len(self.job_queue))
         self.trigger()
 
+    def assign_jobs(self, jobs: Sequence[Job]):
+        """Queue a whole route at once, triggering only after every job is enqueued"""
+        self.job_queue.extend(jobs)
+        logger.info("Robot {} {} jobs queued (queue size: {})", self.name, len(jobs), len(self.job_queue))
+        self.trigger()
+
     def update_job_status(self, status: OrderStatus):
         if self.current_job is None:
             return
@@ -1,31 +1,80 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
-from supabase import create_client, Client
+import msgspec
+import orjson
+from supabase import create_client, Client, ClientOptions
 
 from fleet_gateway.enums import NodeType
+from fleet_gateway.api.types import Node
 
-_NODE_TYPE_LOOKUP: dict[str, NodeType] = {
-    'waypoint': NodeType.WAYPOINT,
-    'conveyor': NodeType.CONVEYOR,
-    'shelf':    NodeType.SHELF,
-    'cell':     NodeType.CELL,
-    'depot':    NodeType.DEPOT,
-}
-
-if TYPE_CHECKING:
-    from fleet_gateway.api.types import Node
+# Supabase stores node types as lowercase member names, e.g. 'waypoint' -> NodeType.WAYPOINT
+_NODE_TYPE_LOOKUP: dict[str, NodeType] = {member.name.lower(): member for member in NodeType}
 
 from loguru import logger
 
+# One keep-alive HTTP/2 pool shared by every RouteOracle RPC (and ping); timeout matches supabase's postgrest default
+_HTTP_TIMEOUT = 120.0
+_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+
+# Cached nodes are served as-is while fresh, served and refreshed in the background while stale, refetched once expired
+_NODE_CACHE_TTL = 300.0
+_NODE_CACHE_STALE_GRACE = 60.0
+
+# Shortest paths between the same pair of nodes are reused for as long as nodes are; least recently used go first past the cap
+_PATH_CACHE_TTL = _NODE_CACHE_TTL
+_PATH_CACHE_MAX_SIZE = 10_000
+
+_RPC_FUNCTIONS = (
+    "wh_get_node_by_tag_id",
+    "wh_get_nodes_by_ids",
+    "wh_get_nodes_by_aliases",
+    "wh_astar_shortest_path",
+)
+
+
+
+class _NodeRow(msgspec.Struct):
+    """Columns of the wh_get_node* RPCs that RouteOracle reads; other columns are skipped while decoding."""
+    id: int
+    x: float
+    y: float
+    type: str | None = None
+    alias: str | None = None
+    tag_id: str | None = None
+    height: float | None = None
+
+
+# Node RPC bodies decode straight into structs, never materializing a dict per row
+_NODE_ROWS_DECODER = msgspec.json.Decoder(list[_NodeRow])
+
 
 class RouteOracle:
     def __init__(self, supabase_url: str, supabase_key: str, graph_id: int | None):
         self.url: str = supabase_url
         self.key: str = supabase_key
         self.graph_id: int | None = graph_id
-        self.supabase: Client = create_client(self.url, self.key)
+        self.http: httpx.Client = httpx.Client(http2=True, timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+        self.supabase: Client = create_client(self.url, self.key, options=ClientOptions(httpx_client=self.http))
+        # RPC endpoints and headers are fixed per client; only the JSON body changes between calls
+        postgrest = self.supabase.postgrest
+        self._rpc_urls: dict[str, str] = {fn: str(postgrest.base_url.joinpath("rpc", fn)) for fn in _RPC_FUNCTIONS}
+        self._rpc_headers: dict[str, str] = {**postgrest.headers, "content-type": "application/json"}
+        # Graph nodes rarely change per graph_id; keyed by (graph_id, id) and (graph_id, alias) -> (fetched_at, node)
+        self._node_cache: dict[tuple[int, int | str], tuple[float, Node]] = {}
+        self._refreshing: set[tuple[int, int | str]] = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="route-oracle-refresh")
+        # Keyed by (graph_id, tag_id) -> (fetched_at, node); apart from _node_cache so tag ids never shadow aliases
+        self._tag_cache: dict[tuple[int, str], tuple[float, Node]] = {}
+        # Keyed by (graph_id, start, end) -> (fetched_at, path node ids), least recently used first
+        self._path_cache: OrderedDict[tuple[int, int | str, int | str], tuple[float, tuple[int, ...]]] = OrderedDict()
+        self._path_lock = threading.Lock()
 
     def _resolve_graph_id(self, graph_id: int | None) -> int:
         if graph_id is not None:
@@ -34,38 +83,84 @@ class RouteOracle:
             return self.graph_id
         raise RuntimeError("Unknown graph_id, define in function or ctor")
 
-    def _row_to_node(self, data: dict) -> Node:
-        from fleet_gateway.api.types import Node
-        node_type = _NODE_TYPE_LOOKUP.get(data["type"])
-        if node_type is None:
-            logger.warning("Unknown node type {!r}, falling back to WAYPOINT", data["type"])
-            node_type = NodeType.WAYPOINT
+    def _row_to_node(self, row: _NodeRow) -> Node:
+        node_type = _NODE_TYPE_LOOKUP.get(row.type) or self._unknown_node_type(row.type)
         return Node(
-            id=data["id"],
-            alias=data.get("alias") or "",
-            tag_id=data.get("tag_id") or "",
-            x=data["x"],
-            y=data["y"],
-            height=data["height"] if data["height"] is not None else 0.0,
+            id=row.id,
+            alias=row.alias or "",
+            tag_id=row.tag_id or "",
+            x=row.x,
+            y=row.y,
+            height=row.height if row.height is not None else 0.0,
             node_type=node_type,
         )
 
+    def _post_rpc(self, fn: str, params: dict) -> bytes:
+        """POST a known RPC straight through the pooled client, skipping the postgrest request builder."""
+        r = self.http.post(self._rpc_urls[fn], content=orjson.dumps(params), headers=self._rpc_headers)
+        r.raise_for_status()
+        return r.content
+
+    def _rpc(self, fn: str, params: dict):
+        return orjson.loads(self._post_rpc(fn, params))
+
+    def _rpc_nodes(self, fn: str, params: dict) -> list[_NodeRow]:
+        return _NODE_ROWS_DECODER.decode(self._post_rpc(fn, params))
+
+    @staticmethod
+    def _unknown_node_type(value: str | None) -> NodeType:
+        logger.warning("Unknown node type {!r}, falling back to WAYPOINT", value)
+        return NodeType.WAYPOINT
+
     def ping(self) -> None:
         """Raise if Supabase is not reachable (hits /health, no DB query)."""
-        r = httpx.get(f"{self.url}/rest-admin/v1/live", timeout=5.0)
+        r = self.http.get(f"{self.url}/rest-admin/v1/live", timeout=5.0)
         r.raise_for_status()
 
+    def close(self) -> None:
+        """Stop background node refreshes and close the pooled HTTP connections."""
+        self._refresh_executor.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
+
+    def _refresh_node(self, key: tuple[int, int | str]) -> None:
+        try:
+            self._fetch_nodes([key[1]], key[0])
+        except Exception as e:
+            logger.warning("Background refresh of node {!r} failed: {}", key[1], e)
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(key)
+
+    def _schedule_refresh(self, key: tuple[int, int | str]) -> None:
+        with self._refresh_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        self._refresh_executor.submit(self._refresh_node, key)
+
     def get_node_by_tag_id(self, tag_id: str, graph_id: int | None = None) -> Node | None:
         graph_id = self._resolve_graph_id(graph_id)
-        res = self.supabase.rpc(
-            "wh_get_node_by_tag_id",
-            {"p_graph_id": graph_id, "p_tag_id": tag_id},
-        ).execute()
-        if not res.data:
+        cached = self._tag_cache.get((graph_id, tag_id))
+        if cached is not None and time.monotonic() - cached[0] < _NODE_CACHE_TTL:
+            return cached[1]
+        rows = self._rpc_nodes("wh_get_node_by_tag_id", {"p_graph_id": graph_id, "p_tag_id": tag_id})
+        if not rows:
             return None
-        return self._row_to_node(res.data[0])
+        node = self._row_to_node(rows[0])
+        self._cache_nodes([node], graph_id)
+        return node
 
     def get_node(self, node_id: int | str, graph_id: int | None = None) -> Node | None:
+        graph_id = self._resolve_graph_id(graph_id)
+        cached = self._node_cache.get((graph_id, node_id))
+        if cached is not None:
+            fetched_at, node = cached
+            age = time.monotonic() - fetched_at
+            if age < _NODE_CACHE_TTL:
+                return node
+            if age < _NODE_CACHE_TTL + _NODE_CACHE_STALE_GRACE:
+                self._schedule_refresh((graph_id, node_id))
+                return node
         nodes = self.get_nodes([node_id], graph_id)
         return nodes[0] if nodes else None
 
@@ -73,25 +168,61 @@ class RouteOracle:
         graph_id = self._resolve_graph_id(graph_id)
         if not node_ids:
             return []
+        # Serve fresh cache hits directly and fetch every miss in one RPC
+        now = time.monotonic()
+        found: dict[int | str, Node] = {}
+        misses: list[int] | list[str] = []
+        for node_id in node_ids:
+            cached = self._node_cache.get((graph_id, node_id))
+            if cached is not None and now - cached[0] < _NODE_CACHE_TTL:
+                found[node_id] = cached[1]
+            else:
+                misses.append(node_id)
+        if misses:
+            by_id = isinstance(misses[0], int)
+            for node in self._fetch_nodes(list(dict.fromkeys(misses)), graph_id):
+                found[node.id if by_id else node.alias] = node
+        return [found[node_id] for node_id in node_ids if node_id in found]
+
+    def _fetch_nodes(self, node_ids: list[int] | list[str], graph_id: int) -> list[Node]:
         if isinstance(node_ids[0], int):
-            res = self.supabase.rpc(
-                "wh_get_nodes_by_ids",
-                {"p_graph_id": graph_id, "p_node_ids": node_ids},
-            ).execute()
+            rows = self._rpc_nodes("wh_get_nodes_by_ids", {"p_graph_id": graph_id, "p_node_ids": node_ids})
         else:
-            res = self.supabase.rpc(
-                "wh_get_nodes_by_aliases",
-                {"p_graph_id": graph_id, "p_node_aliases": node_ids},
-            ).execute()
-        return [self._row_to_node(row) for row in res.data]
+            rows = self._rpc_nodes("wh_get_nodes_by_aliases", {"p_graph_id": graph_id, "p_node_aliases": node_ids})
+        nodes = [self._row_to_node(row) for row in rows]
+        self._cache_nodes(nodes, graph_id)
+        return nodes
+
+    def _cache_nodes(self, nodes: list[Node], graph_id: int) -> None:
+        fetched_at = time.monotonic()
+        for node in nodes:
+            self._node_cache[(graph_id, node.id)] = (fetched_at, node)
+            if node.alias:
+                self._node_cache[(graph_id, node.alias)] = (fetched_at, node)
+            if node.tag_id:
+                self._tag_cache[(graph_id, node.tag_id)] = (fetched_at, node)
 
     def get_shortest_path(self, start: int | str, end: int | str, graph_id: int | None = None) -> list[int]:
         graph_id = self._resolve_graph_id(graph_id)
+        key = (graph_id, start, end)
+        with self._path_lock:
+            cached = self._path_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < _PATH_CACHE_TTL:
+                self._path_cache.move_to_end(key)
+                return list(cached[1])
         if isinstance(start, int):
             params = {"p_graph_id": graph_id, "p_start_vid": start, "p_end_vid": end}
         else:
             params = {"p_graph_id": graph_id, "p_start_alias": start, "p_end_alias": end}
-        return self.supabase.rpc("wh_astar_shortest_path", params).execute().data
+        path = self._rpc("wh_astar_shortest_path", params)
+        # Empty results are not cached so a path missing because of a graph edit is found once the edit lands
+        if path:
+            with self._path_lock:
+                self._path_cache[key] = (time.monotonic(), tuple(path))
+                self._path_cache.move_to_end(key)
+                while len(self._path_cache) > _PATH_CACHE_MAX_SIZE:
+                    self._path_cache.popitem(last=False)
+        return path
 
 # def main():
 #     url: str = "http://10.61.6.65:54321/"
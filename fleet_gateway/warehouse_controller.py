@@ -5,20 +5,17 @@ import asyncio
 
 from fleet_gateway.enums import JobOperation, NodeType, OrderStatus
 
+from fleet_gateway.api.types import Job, Request, JobOrderResult, RequestOrderResult, WarehouseOrderResult
+
 if TYPE_CHECKING:
     from fleet_gateway.api.types import (
         Node,
-        Job,
-        Request,
         RequestIDInput,
         RequestAliasInput,
         JobOrderInput,
         RequestOrderInput,
         AssignmentInput,
         WarehouseOrderInput,
-        JobOrderResult,
-        RequestOrderResult,
-        WarehouseOrderResult,
     )
 
 from fleet_gateway.fleet_handler import FleetHandler
@@ -27,6 +24,8 @@ from fleet_gateway.route_oracle import RouteOracle
 
 from loguru import logger
 
+_JOB_UPDATE_BATCH_SIZE = 64  # max job updates flushed to order_store per write
+
 
 class WarehouseController():
     def __init__(self, job_updater: asyncio.Queue, fleet_handler: FleetHandler, order_store: OrderStore, route_oracle: RouteOracle):
@@ -34,22 +33,41 @@ class WarehouseController():
         self.fleet_handler = fleet_handler
         self.order_store = order_store
         self.route_oracle = route_oracle
+        # Last status written for each non-terminal job, so repeated feedback with no change skips the write
+        self._last_status: dict[UUID, OrderStatus] = {}
 
-        # Function to handle in redis
+        # Function to handle in redis, draining whatever is already queued into one batched write
         async def handle_job_updater(queue: asyncio.Queue):
             while True:
-                job = await queue.get()
-                if await self.order_store.set_job(job):
-                    logger.info("Updated job {} status to {} in order_store", job.uuid, job.status)
-                else:
-                    logger.error("Unable to update job {} in order_store", job.uuid)
+                drained: list[Job] = [await queue.get()]
+                while len(drained) < _JOB_UPDATE_BATCH_SIZE:
+                    try:
+                        drained.append(queue.get_nowait())
+                    except asyncio.QueueEmpty:
+                        break
+                # Repeated updates for one job collapse into a single write of its latest state
+                latest = {job.uuid: (job, job.status) for job in drained}
+                batch = [job for job, status in latest.values() if self._last_status.get(job.uuid) != status]
+                if not batch:
+                    continue
+                for job, stored in zip(batch, await self.order_store.set_jobs(batch)):
+                    if stored:
+                        self._remember_status(job.uuid, latest[job.uuid][1])
+                        logger.debug("Updated job {} status to {} in order_store", job.uuid, job.status)
+                    else:
+                        logger.error("Unable to update job {} in order_store", job.uuid)
 
         self._updater_task = asyncio.create_task(handle_job_updater(self.job_updater))
 
-    async def accept_job_order(self, job_order: JobOrderInput) -> JobOrderResult:
-        from fleet_gateway.api.types import Job, JobOrderResult
+    def _remember_status(self, uuid: UUID, status: OrderStatus):
+        # Terminal jobs get no further updates, so they are dropped to keep the map bounded
+        if status in (OrderStatus.COMPLETED, OrderStatus.CANCELED, OrderStatus.FAILED):
+            self._last_status.pop(uuid, None)
+        else:
+            self._last_status[uuid] = status
 
-        if self.fleet_handler.get_robot(job_order.robot_name) is None:
+    async def accept_job_order(self, job_order: JobOrderInput) -> JobOrderResult:
+        if not self.fleet_handler.has_robot(job_order.robot_name):
             raise RuntimeError(f"Robot {job_order.robot_name} not found")
 
         target_node = self.route_oracle.get_node(job_order.target_node_alias or job_order.target_node_id)
@@ -70,101 +88,105 @@ class WarehouseController():
         return JobOrderResult(success=True, message="Successfully save job into order_store and robot", job=job)
     
 
-    async def create_request_jobs(self, pd_nodes: tuple[Node, Node], robot_name: str) -> tuple[Request, Job, Job]:
-        from fleet_gateway.api.types import Job, Request
+    def build_request_jobs(self, pd_nodes: tuple[Node, Node], robot_name: str) -> tuple[Request, Job, Job]:
+        """Construct a request and its pickup/delivery jobs without touching order_store"""
         request_uuid: UUID = uuid4()
         pickup_job = Job(uuid=uuid4(), status=OrderStatus.QUEUING, operation=JobOperation.PICKUP,
                          target_node=pd_nodes[0], request_uuid=request_uuid, handling_robot_name=robot_name)
-        if not await self.order_store.set_job(pickup_job):
-            raise RuntimeError("Unable to store pickup job")
-
         delivery_job = Job(uuid=uuid4(), status=OrderStatus.QUEUING, operation=JobOperation.DELIVERY,
                            target_node=pd_nodes[1], request_uuid=request_uuid, handling_robot_name=robot_name)
-        if not await self.order_store.set_job(delivery_job):
-            raise RuntimeError("Unable to store delivery job")
-
         request = Request(uuid=request_uuid, pickup_uuid=pickup_job.uuid,
                           delivery_uuid=delivery_job.uuid, handling_robot_name=robot_name)
-        if not await self.order_store.set_request(request):
-            raise RuntimeError("Unable to store request")
-        
         return request, pickup_job, delivery_job
 
     async def accept_request_order(self, request_order: RequestOrderInput) -> RequestOrderResult:
-        from fleet_gateway.api.types import RequestOrderResult
-
         if request_order.request_id is None and request_order.request_alias is None:
             return RequestOrderResult(success=False, message="Either request_id or request_alias must be provided", request=None)
 
-        if self.fleet_handler.get_robot(request_order.robot_name) is None:
+        if not self.fleet_handler.has_robot(request_order.robot_name):
             return RequestOrderResult(success=False, message=f"Robot {request_order.robot_name} not found", request=None)
 
-        node_specifiers: list[int] | list[str]
-        if request_order.request_id is not None:
-            node_specifiers = [request_order.request_id.pickup_node_id, request_order.request_id.delivery_node_id]
+        use_ids = request_order.request_id is not None
+        pickup: int | str
+        delivery: int | str
+        if use_ids:
+            pickup, delivery = request_order.request_id.pickup_node_id, request_order.request_id.delivery_node_id
         else:
-            node_specifiers = [request_order.request_alias.pickup_node_alias, request_order.request_alias.delivery_node_alias]
+            pickup, delivery = request_order.request_alias.pickup_node_alias, request_order.request_alias.delivery_node_alias
 
-        pd_nodes_list = self.route_oracle.get_nodes(node_specifiers)
-        if len(pd_nodes_list) != 2:
+        # Look each distinct node up once and map results back by specifier, so pickup == delivery costs one lookup
+        nodes_by_spec: dict[int, Node] | dict[str, Node] = {
+            (node.id if use_ids else node.alias): node for node in self.route_oracle.get_nodes(list(dict.fromkeys((pickup, delivery))))
+        }
+        if pickup not in nodes_by_spec or delivery not in nodes_by_spec:
             return RequestOrderResult(success=False, message="One or both nodes not found", request=None)
-        pd_nodes: tuple[Node, Node] = (pd_nodes_list[0], pd_nodes_list[1])
-        request, pickup_job, delivery_job = await self.create_request_jobs(pd_nodes, request_order.robot_name)
-        
-        self.fleet_handler.assign_job(request_order.robot_name, pickup_job)
-        self.fleet_handler.assign_job(request_order.robot_name, delivery_job)
+        pd_nodes: tuple[Node, Node] = (nodes_by_spec[pickup], nodes_by_spec[delivery])
+        request, pickup_job, delivery_job = self.build_request_jobs(pd_nodes, request_order.robot_name)
+
+        # Both jobs and the request go out in a single order_store round trip
+        pickup_stored, delivery_stored, request_stored = await self.order_store.set_jobs_and_requests([pickup_job, delivery_job], [request])
+        if not pickup_stored:
+            return RequestOrderResult(success=False, message="Unable to store pickup job", request=None)
+        if not delivery_stored:
+            return RequestOrderResult(success=False, message="Unable to store delivery job", request=None)
+        if not request_stored:
+            return RequestOrderResult(success=False, message="Unable to store request", request=None)
+
+        self.fleet_handler.assign_jobs(request_order.robot_name, (pickup_job, delivery_job))
         return RequestOrderResult(success=True, message="Successfully saved request into order_store and robot queue", request=request)
 
-    def create_node_to_robot_dict(self, assignments: list[AssignmentInput]) -> dict[int, str] | dict[str, str]:
+    def build_assignment_indices(self, assignments: list[AssignmentInput]) -> tuple[dict[int, str] | dict[str, str], dict[str, dict[int, int]] | dict[str, dict[str, int]]]:
+        """Single pass over assignments building node -> robot and robot -> {node: route index}"""
         node_to_robot: dict[int, str] | dict[str, str] = {}
+        robot_to_node_indices: dict[str, dict[int, int]] | dict[str, dict[str, int]] = {}
         for assignment in assignments:
-            if self.fleet_handler.get_robot(assignment.robot_name) is None:
+            if not self.fleet_handler.has_robot(assignment.robot_name):
                 raise RuntimeError(f"Robot '{assignment.robot_name}' not found in fleet")
             if assignment.route_node_ids is None and assignment.route_node_aliases is None:
                 raise RuntimeError(f"Assignment for '{assignment.robot_name}' must provide route_node_ids or route_node_aliases")
             if assignment.route_node_ids is not None and assignment.route_node_aliases is not None:
                 raise RuntimeError(f"Assignment for '{assignment.robot_name}' must provide route_node_ids or route_node_aliases, not both")
-            
-            route_node : list[int] | list[str] = []
-            route_node = assignment.route_node_ids or assignment.route_node_aliases
 
-            for node in route_node:
-                node_to_robot[node] = assignment.robot_name
-
-        return node_to_robot
+            route_node : list[int] | list[str] = assignment.route_node_ids or assignment.route_node_aliases
 
-    def create_robot_to_node_incides(self, assignments: list[AssignmentInput]) -> dict[str, dict[int, int]] | dict[str, dict[str, int]]:
-        robot_to_node_incides: dict[str, dict[int, int]] | dict[str, dict[str, int]] = {}
-        for assignment in assignments:
             node_to_idx: dict[int, int] | dict[str, int] = {}
-            for idx, node in enumerate(assignment.route_node_ids or assignment.route_node_aliases):
+            for idx, node in enumerate(route_node):
+                node_to_robot[node] = assignment.robot_name
                 node_to_idx[node] = idx
-            robot_to_node_incides[assignment.robot_name] = node_to_idx
-        return robot_to_node_incides
+            robot_to_node_indices[assignment.robot_name] = node_to_idx
 
-    async def accept_warehouse_order(self, warehouse_order: WarehouseOrderInput) -> WarehouseOrderResult:
-        from fleet_gateway.api.types import WarehouseOrderResult
+        return node_to_robot, robot_to_node_indices
 
+    async def accept_warehouse_order(self, warehouse_order: WarehouseOrderInput) -> WarehouseOrderResult:
         if warehouse_order.request_ids is None and warehouse_order.request_aliases is None:
             return WarehouseOrderResult(success=False, message="Either request_ids or request_aliases must be provided", requests=[])
         if warehouse_order.request_ids is not None and warehouse_order.request_aliases is not None:
             return WarehouseOrderResult(success=False, message="Provide either request_ids or request_aliases, not both", requests=[])
 
         use_ids = warehouse_order.request_ids is not None
-        node_to_robot : dict[int, str] | dict[str, str] = self.create_node_to_robot_dict(warehouse_order.assignments)
-        robot_to_node_indices: dict[str, dict[int, int]] | dict[str, dict[str, int]] = self.create_robot_to_node_incides(warehouse_order.assignments)
+        node_to_robot, robot_to_node_indices = self.build_assignment_indices(warehouse_order.assignments)
         robot_job_route: dict[str, list[Job]] = { asm.robot_name: [None] * len(asm.route_node_ids or asm.route_node_aliases) for asm in warehouse_order.assignments }
 
         requests: list[Request] = []
-
-        for r in warehouse_order.request_ids or warehouse_order.request_aliases:
+        jobs: list[Job] = []
+
+        # Resolve every pickup/delivery node in one route_oracle query instead of one per request
+        request_inputs = warehouse_order.request_ids or warehouse_order.request_aliases
+        node_specifiers: list[int] | list[str] = list(dict.fromkeys(
+            spec for r in request_inputs
+            for spec in ((r.pickup_node_id, r.delivery_node_id) if use_ids else (r.pickup_node_alias, r.delivery_node_alias))
+        ))
+        nodes_by_spec: dict[int, Node] | dict[str, Node] = {
+            (node.id if use_ids else node.alias): node for node in self.route_oracle.get_nodes(node_specifiers)
+        }
+
+        for r in request_inputs:
             pickup: int | str = r.pickup_node_id if use_ids else r.pickup_node_alias
             delivery: int | str = r.delivery_node_id if use_ids else r.delivery_node_alias
 
-            nodes_list = self.route_oracle.get_nodes([pickup, delivery])
-            if len(nodes_list) != 2:
+            if pickup not in nodes_by_spec or delivery not in nodes_by_spec:
                 return WarehouseOrderResult(success=False, message=f"One or both nodes not found: {pickup!r}, {delivery!r}", requests=[])
-            nodes: tuple[Node, Node] = (nodes_list[0], nodes_list[1])
+            nodes: tuple[Node, Node] = (nodes_by_spec[pickup], nodes_by_spec[delivery])
 
             if pickup not in node_to_robot or delivery not in node_to_robot:
                 return WarehouseOrderResult(success=False, message=f"Node {pickup!r} or {delivery!r} not assigned to any robot", requests=[])
@@ -177,42 +199,51 @@ class WarehouseController():
             if pickup not in robot_to_node_indices[robot_name] or delivery not in robot_to_node_indices[robot_name]:
                 return WarehouseOrderResult(success=False, message=f"Node {pickup!r} or {delivery!r} not in robot {robot_name!r} route", requests=[])
 
-            request, pickup_job, delivery_job = await self.create_request_jobs(nodes, robot_name)
+            request, pickup_job, delivery_job = self.build_request_jobs(nodes, robot_name)
 
             robot_job_route[robot_name][robot_to_node_indices[robot_name][pickup]] = pickup_job
             robot_job_route[robot_name][robot_to_node_indices[robot_name][delivery]] = delivery_job
             requests.append(request)
+            jobs.extend((pickup_job, delivery_job))
+
+        # Every job and request is written in one order_store pipeline once all of them validated
+        stored = await self.order_store.set_jobs_and_requests(jobs, requests)
+        if not all(stored):
+            failed = [order.uuid for order, ok in zip((*jobs, *requests), stored) if not ok]
+            logger.error("Unable to store {} of {} job(s) and request(s) in order_store: {}", len(failed), len(stored), failed)
+            return WarehouseOrderResult(success=False, message="Unable to store requests in order_store", requests=[])
 
         for robot, job_route in robot_job_route.items():
-            for job in job_route:
-                if job is not None:
-                    self.fleet_handler.assign_job(robot, job)
+            self.fleet_handler.assign_jobs(robot, [job for job in job_route if job is not None])
 
         return WarehouseOrderResult(success=True, message=f"Successfully created {len(requests)} request(s)", requests=requests)
 
     async def cancel_job_order(self, uuid: UUID) -> Job | None:
-        job = await self.order_store.get_job(uuid)
-        if job is None:
-            return None
-        if job.status in (OrderStatus.COMPLETED, OrderStatus.CANCELED, OrderStatus.FAILED):
-            return job
-        self.fleet_handler.remove_queued_job(job.handling_robot_name, uuid)
-        job.status = OrderStatus.CANCELED
-        await self.order_store.set_job(job)
-        return job
+        jobs = await self.cancel_job_orders([uuid])
+        return jobs[0] if jobs else None
 
     async def cancel_job_orders(self, uuids: list[UUID]) -> list[Job]:
-        results = [await self.cancel_job_order(uuid) for uuid in uuids]
-        return [job for job in results if job is not None]
+        jobs = [job for job in await self.order_store.get_jobs_by_uuids(uuids) if job is not None]
+        # Terminal jobs are returned untouched; live ones leave their robot queue before CANCELED is written
+        canceled = [job for job in jobs if job.status not in (OrderStatus.COMPLETED, OrderStatus.CANCELED, OrderStatus.FAILED)]
+        for job in canceled:
+            self.fleet_handler.remove_queued_job(job.handling_robot_name, job.uuid)
+            job.status = OrderStatus.CANCELED
+        if canceled:
+            for job, stored in zip(canceled, await self.order_store.set_jobs(canceled)):
+                if stored:
+                    self._remember_status(job.uuid, job.status)
+                else:
+                    logger.error("Unable to store canceled job {} in order_store", job.uuid)
+        return jobs
 
     async def cancel_request_order(self, uuid: UUID) -> Request | None:
-        request = await self.order_store.get_request(uuid)
-        if request is None:
-            return None
-        await self.cancel_job_order(request.pickup_uuid)
-        await self.cancel_job_order(request.delivery_uuid)
-        return request
+        requests = await self.cancel_request_orders([uuid])
+        return requests[0] if requests else None
 
     async def cancel_request_orders(self, uuids: list[UUID]) -> list[Request]:
-        results = [await self.cancel_request_order(uuid) for uuid in uuids]
-        return [r for r in results if r is not None]
+        # One pipelined read for every request, then one bulk cancel over all of their jobs
+        requests = [request for request in await self.order_store.get_requests_by_uuids(uuids) if request is not None]
+        if requests:
+            await self.cancel_job_orders([uuid for request in requests for uuid in (request.pickup_uuid, request.delivery_uuid)])
+        return requests
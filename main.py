@@ -1,12 +1,14 @@
 import asyncio
-import json
 import os
+import sys
 from contextlib import asynccontextmanager
 from loguru import logger
 
+import orjson
 import redis.asyncio as redis
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
+from strawberry.dataloader import DataLoader
 from strawberry.fastapi import GraphQLRouter
 
 from fleet_gateway.fleet_handler import FleetHandler
@@ -22,60 +24,95 @@ load_dotenv()
 # Configuration loaded from .env
 REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
 REDIS_PORT = int(os.getenv('REDIS_PORT', '6379'))
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', '64'))
 SUPABASE_URL = os.getenv('SUPABASE_URL', '')
 SUPABASE_KEY = os.getenv('SUPABASE_KEY', '')
 GRAPH_ID = int(os.getenv('GRAPH_ID', '1'))
-ROBOTS_CONFIG = json.loads(os.getenv('ROBOTS_CONFIG', '{}'))
+ROBOTS_CONFIG = orjson.loads(os.getenv('ROBOTS_CONFIG', '{}'))
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'DEBUG')
+
+def configure_logging():
+    """Replace loguru's default sink with one that hands records to a background writer,
+    so stderr I/O never runs on the event loop"""
+    logger.remove()
+    logger.add(sys.stderr, level=LOG_LEVEL, enqueue=True)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    configure_logging()
+
     # Initialize RouteOracle (Supabase client)
     app.state.route_oracle = RouteOracle(SUPABASE_URL, SUPABASE_KEY, GRAPH_ID)
-    try:
-        app.state.route_oracle.ping()
-        logger.info("Supabase connection succeeded (url={!r})", SUPABASE_URL)
-    except Exception as e:
-        logger.error("Unable to connect to Supabase (url={!r}): {}", SUPABASE_URL, e)
-        raise
 
-    # Initialize Redis connection
-    app.state.redis = redis.Redis(
+    # Initialize Redis connection; one bounded pool shared by every order_store call for the app's lifetime
+    app.state.redis_pool = redis.BlockingConnectionPool(
         host=REDIS_HOST,
         port=REDIS_PORT,
-        decode_responses=True
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
     )
+    app.state.redis = redis.Redis(connection_pool=app.state.redis_pool)
+
+    warehouse_controller: WarehouseController | None = None
+    # Everything from the health checks on runs under the try, so a failed startup still closes the clients above
     try:
-        await app.state.redis.ping()
-    except Exception as e:
-        logger.error("Unable to connect to Redis at {}:{}: {}", REDIS_HOST, REDIS_PORT, e)
-        raise
+        # Both health checks are independent, so wait for them together; the blocking Supabase ping runs off the loop
+        supabase_error, redis_error = await asyncio.gather(
+            asyncio.to_thread(app.state.route_oracle.ping),
+            app.state.redis.ping(),
+            return_exceptions=True,
+        )
+        if isinstance(supabase_error, Exception):
+            logger.error("Unable to connect to Supabase (url={!r}): {}", SUPABASE_URL, supabase_error)
+        if isinstance(redis_error, Exception):
+            logger.error("Unable to connect to Redis at {}:{}: {}", REDIS_HOST, REDIS_PORT, redis_error)
+        for error in (supabase_error, redis_error):
+            if isinstance(error, Exception):
+                raise error
+        logger.info("Supabase connection succeeded (url={!r})", SUPABASE_URL)
 
-    app.state.job_updater = asyncio.Queue()
+        app.state.job_updater = asyncio.Queue()
 
-    app.state.order_store = OrderStore(app.state.redis)
+        app.state.order_store = OrderStore(app.state.redis)
 
-    app.state.fleet_handler = FleetHandler(app.state.job_updater, app.state.route_oracle, ROBOTS_CONFIG)
+        app.state.fleet_handler = FleetHandler(app.state.job_updater, app.state.route_oracle, ROBOTS_CONFIG)
 
-    app.state.warehouse_controller = WarehouseController(app.state.job_updater, app.state.fleet_handler, app.state.order_store, app.state.route_oracle)
+        app.state.warehouse_controller = warehouse_controller = WarehouseController(app.state.job_updater, app.state.fleet_handler, app.state.order_store, app.state.route_oracle)
 
-    try:
         yield
     finally:
-        app.state.warehouse_controller._updater_task.cancel()
+        if warehouse_controller is not None:
+            warehouse_controller._updater_task.cancel()
         await app.state.redis.aclose()
+        await app.state.redis_pool.disconnect()
+        app.state.route_oracle.close()
+        await logger.complete()
 
 async def get_context(request: Request):
+    order_store: OrderStore = request.app.state.order_store
     return {
         "request": request,
-        "order_store": request.app.state.order_store,
+        "order_store": order_store,
+        # Built per request so batching and caching never leak across requests
+        "job_loader": DataLoader(load_fn=order_store.get_jobs_by_uuids),
+        "request_loader": DataLoader(load_fn=order_store.get_requests_by_uuids),
         "route_oracle": request.app.state.route_oracle,
         "fleet_handler": request.app.state.fleet_handler,
         "warehouse_controller": request.app.state.warehouse_controller,
     }
 
+class ORJSONGraphQLRouter(GraphQLRouter):
+    """GraphQLRouter that decodes request bodies and encodes responses with orjson instead of stdlib json"""
+
+    def decode_json(self, data: str | bytes) -> object:
+        return orjson.loads(data)
+
+    def encode_json(self, data: object) -> bytes:
+        return orjson.dumps(data)
+
 # Create GraphQL router with context getter
 # Note: The schema is already created in fleet_gateway.api.schema
-graphql_app = GraphQLRouter(schema, context_getter=get_context, graphql_ide="apollo-sandbox")
+graphql_app = ORJSONGraphQLRouter(schema, context_getter=get_context, graphql_ide="apollo-sandbox")
 
 app = FastAPI(lifespan=lifespan)
 app.include_router(graphql_app, prefix="/graphql")
@@ -6,6 +6,7 @@ with all fields intact.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch, call
@@ -15,6 +16,7 @@ from fleet_gateway.enums import OrderStatus, JobOperation, NodeType
 from fleet_gateway.api.types import Job, Node, Request
 from fleet_gateway.helpers.serializers import job_to_dict, node_to_dict, request_to_dict
 from fleet_gateway.helpers.deserializers import dict_to_job, dict_to_node, dict_to_request
+from fleet_gateway.helpers.request_status import derive_request_status
 from fleet_gateway.order_store import OrderStore
 
 
@@ -198,6 +200,21 @@ class TestRequestSerialization:
         assert result is None
 
 
+# ---------------------------------------------------------------------------
+# api.types slots
+# ---------------------------------------------------------------------------
+
+def test_job_and_request_are_slotted():
+    """Job, Request and Node carry no per-instance __dict__; Job stays mutable."""
+    job = make_job()
+    request = make_request(pickup_uuid=job.uuid)
+    assert not hasattr(job, "__dict__")
+    assert not hasattr(request, "__dict__")
+    job.status = OrderStatus.CANCELED
+    assert job.status == OrderStatus.CANCELED
+    assert not hasattr(job.target_node, "__dict__")
+
+
 # ---------------------------------------------------------------------------
 # OrderStore.set_job / get_job via mock Redis
 # ---------------------------------------------------------------------------
@@ -219,6 +236,183 @@ class TestOrderStoreJobPersistence:
         key = mock_redis.hset.call_args[0][0]
         assert key == f"job:{str(job.uuid)}"
 
+    @pytest.mark.asyncio
+    async def test_set_jobs_uses_single_pipeline(self, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 1, 1])
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+        jobs = [make_job() for _ in range(3)]
+
+        result = await store.set_jobs(jobs)
+
+        assert result == [True, True, True]
+        assert pipe.hset.call_count == 3
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_jobs_reports_per_job_failure(self, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, Exception("boom")])
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+
+        result = await store.set_jobs([make_job(), make_job()])
+
+        assert result == [True, False]
+
+    @pytest.mark.asyncio
+    async def test_set_jobs_reports_unserializable_job_without_failing_others(self, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1])
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+        broken, job = make_job(), make_job()
+        broken.target_node = None
+
+        result = await store.set_jobs([broken, job])
+
+        assert result == [False, True]
+        assert [c[0][0] for c in pipe.hset.call_args_list] == [f"job:{job.uuid}"]
+
+    @pytest.mark.asyncio
+    async def test_set_jobs_and_requests_share_one_pipeline(self, mock_redis):
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, Exception("boom"), 1])
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+        pickup, delivery = make_job(), make_job(operation=JobOperation.DELIVERY)
+        request = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
+
+        result = await store.set_jobs_and_requests([pickup, delivery], [request])
+
+        assert result == [True, False, True]
+        assert [c[0][0] for c in pipe.hset.call_args_list] == [
+            f"job:{pickup.uuid}", f"job:{delivery.uuid}", f"request:{request.uuid}",
+        ]
+        pipe.execute.assert_awaited_once()
+        mock_redis.hset.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_by_uuids_keeps_order_and_missing(self, mock_redis):
+        job = make_job()
+        missing = uuid4()
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[{}, {k: str(v) for k, v in job_to_dict(job).items()}])
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+
+        result = await store.get_jobs_by_uuids([missing, job.uuid])
+
+        assert result[0] is None
+        assert result[1].uuid == job.uuid
+        mock_redis.hgetall.assert_not_called()
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_skips_keys_scan_returns_twice(self, mock_redis):
+        job = make_job()
+        key = f"job:{job.uuid}"
+
+        async def scan_iter(match, count):
+            for k in (key, key):
+                yield k
+
+        mock_redis.scan_iter = scan_iter
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[{k: str(v) for k, v in job_to_dict(job).items()}])
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+
+        result = await store.get_jobs()
+
+        assert [j.uuid for j in result] == [job.uuid]
+        pipe.hgetall.assert_called_once_with(key)
+
+    @staticmethod
+    def scan_jobs(*jobs, error=None):
+        async def scan_iter(match, count):
+            for job in jobs:
+                await asyncio.sleep(0)
+                yield f"job:{job.uuid}"
+            if error is not None:
+                await asyncio.sleep(0)
+                raise error
+        return scan_iter
+
+    @staticmethod
+    def stored(jobs_by_key, pipe):
+        return [{k: str(v) for k, v in job_to_dict(jobs_by_key[c.args[0]]).items()} for c in pipe.hgetall.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_reads_one_batch_at_a_time_in_key_order(self, mock_redis):
+        jobs = [make_job() for _ in range(5)]
+        jobs_by_key = {f"job:{job.uuid}": job for job in jobs}
+        in_flight = max_in_flight = 0
+
+        def pipeline(transaction):
+            pipe = MagicMock()
+
+            async def execute():
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return self.stored(jobs_by_key, pipe)
+
+            pipe.execute = execute
+            return pipe
+
+        mock_redis.scan_iter = self.scan_jobs(*jobs)
+        mock_redis.pipeline.side_effect = pipeline
+        store = OrderStore(mock_redis)
+
+        with patch("fleet_gateway.order_store._SCAN_COUNT", 2):
+            result = await store.get_jobs()
+
+        assert [j.uuid for j in result] == [job.uuid for job in jobs]
+        assert mock_redis.pipeline.call_count == 3
+        assert max_in_flight == 1
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_stops_reading_after_a_failed_batch(self, mock_redis):
+        jobs = [make_job() for _ in range(5)]
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(side_effect=ConnectionError("redis down"))
+        mock_redis.scan_iter = self.scan_jobs(*jobs)
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+
+        with patch("fleet_gateway.order_store._SCAN_COUNT", 2):
+            with pytest.raises(ConnectionError):
+                await store.get_jobs()
+
+        pipe.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_get_jobs_cancels_the_read_in_flight_when_scan_fails(self, mock_redis):
+        cancelled = asyncio.Event()
+
+        async def execute():
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        pipe = MagicMock()
+        pipe.execute = execute
+        mock_redis.scan_iter = self.scan_jobs(make_job(), make_job(), error=ConnectionError("redis down"))
+        mock_redis.pipeline.return_value = pipe
+        store = OrderStore(mock_redis)
+
+        with patch("fleet_gateway.order_store._SCAN_COUNT", 2):
+            with pytest.raises(ConnectionError):
+                await store.get_jobs()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
     @pytest.mark.asyncio
     async def test_get_job_returns_none_when_not_found(self, mock_redis):
         mock_redis.hgetall.return_value = {}
@@ -253,100 +447,53 @@ class TestOrderStoreJobPersistence:
 
 
 # ---------------------------------------------------------------------------
-# OrderStore.get_request_status derived logic
+# derive_request_status
 # ---------------------------------------------------------------------------
 
-class TestGetRequestStatus:
-    @pytest.mark.asyncio
-    async def test_both_completed_returns_completed(self, mock_redis):
+class TestDeriveRequestStatus:
+    def test_both_completed_returns_completed(self):
         pickup = make_job(status=OrderStatus.COMPLETED)
         delivery = make_job(status=OrderStatus.COMPLETED)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.COMPLETED
 
-    @pytest.mark.asyncio
-    async def test_pickup_failed_returns_failed(self, mock_redis):
+    def test_pickup_failed_returns_failed(self):
         pickup = make_job(status=OrderStatus.FAILED)
         delivery = make_job(status=OrderStatus.QUEUING)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.FAILED
 
-    @pytest.mark.asyncio
-    async def test_delivery_failed_returns_failed(self, mock_redis):
+    def test_delivery_failed_returns_failed(self):
         pickup = make_job(status=OrderStatus.COMPLETED)
         delivery = make_job(status=OrderStatus.FAILED)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.FAILED
 
-    @pytest.mark.asyncio
-    async def test_either_canceled_returns_canceled(self, mock_redis):
+    def test_either_canceled_returns_canceled(self):
         pickup = make_job(status=OrderStatus.CANCELED)
         delivery = make_job(status=OrderStatus.QUEUING)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.CANCELED
 
-    @pytest.mark.asyncio
-    async def test_either_in_progress_returns_in_progress(self, mock_redis):
+    def test_either_in_progress_returns_in_progress(self):
         pickup = make_job(status=OrderStatus.IN_PROGRESS)
         delivery = make_job(status=OrderStatus.QUEUING)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.IN_PROGRESS
 
-    @pytest.mark.asyncio
-    async def test_both_queuing_returns_queuing(self, mock_redis):
+    def test_both_queuing_returns_queuing(self):
         pickup = make_job(status=OrderStatus.QUEUING)
         delivery = make_job(status=OrderStatus.QUEUING)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.QUEUING
 
-    @pytest.mark.asyncio
-    async def test_failed_takes_priority_over_canceled(self, mock_redis):
+    def test_failed_takes_priority_over_canceled(self):
         """FAILED should take priority over CANCELED per the status hierarchy."""
         pickup = make_job(status=OrderStatus.FAILED)
         delivery = make_job(status=OrderStatus.CANCELED)
-        req = make_request(pickup_uuid=pickup.uuid, delivery_uuid=delivery.uuid)
-
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(side_effect=[pickup, delivery])
-
-        status = await store.get_request_status(req)
+        status = derive_request_status(pickup, delivery)
         assert status == OrderStatus.FAILED
 
-    @pytest.mark.asyncio
-    async def test_raises_when_jobs_not_found(self, mock_redis):
-        req = make_request()
-        store = OrderStore(mock_redis)
-        store.get_job = AsyncMock(return_value=None)
-
+    def test_raises_when_jobs_not_found(self):
         with pytest.raises(RuntimeError):
-            await store.get_request_status(req)
+            derive_request_status(None, None)
@@ -18,6 +18,7 @@ from fleet_gateway.enums import (
 from fleet_gateway.models import RobotCell
 from fleet_gateway.api.types import Job, Node
 from fleet_gateway.enums import NodeType
+from fleet_gateway.robot import RobotHandler
 
 
 # ---------------------------------------------------------------------------
@@ -40,15 +41,11 @@ def make_job(operation=JobOperation.PICKUP, status=OrderStatus.QUEUING):
 def make_robot_handler(num_cells=3, is_connected=True, action_status=RobotActionStatus.IDLE):
     """Return a fully-mocked RobotHandler without a real ROS connection."""
     with (
-        patch("fleet_gateway.robot.Ros.__init__", return_value=None),
-        patch("fleet_gateway.robot.Ros.run", return_value=None),
+        patch.multiple("fleet_gateway.robot.Ros", __init__=MagicMock(return_value=None), run=MagicMock(return_value=None)),
+        patch.multiple("fleet_gateway.robot.Topic", __init__=MagicMock(return_value=None), subscribe=MagicMock(return_value=None)),
         patch("fleet_gateway.robot.ActionClient.__init__", return_value=None),
-        patch("fleet_gateway.robot.Topic.__init__", return_value=None),
-        patch("fleet_gateway.robot.Topic.subscribe", return_value=None),
         patch("asyncio.get_running_loop"),
     ):
-        from fleet_gateway.robot import RobotHandler
-
         job_updater = asyncio.Queue()
         route_oracle = MagicMock()
 
@@ -169,18 +166,18 @@ class TestUpdateJobStatus:
         for cell in handler.cells:
             assert cell.holding_uuid is None
 
-    def test_terminal_status_clears_current_job(self):
+    @pytest.mark.parametrize("terminal", [OrderStatus.COMPLETED, OrderStatus.CANCELED, OrderStatus.FAILED])
+    def test_terminal_status_clears_current_job(self, terminal):
         """All terminal statuses must clear current_job and current_cell."""
-        for terminal in (OrderStatus.COMPLETED, OrderStatus.CANCELED, OrderStatus.FAILED):
-            handler = make_robot_handler(num_cells=2)
-            job = make_job(operation=JobOperation.DELIVERY)
-            handler.current_job = job
-            handler.current_cell = None
+        handler = make_robot_handler(num_cells=2)
+        job = make_job(operation=JobOperation.DELIVERY)
+        handler.current_job = job
+        handler.current_cell = None
 
-            handler.update_job_status(terminal)
+        handler.update_job_status(terminal)
 
-            assert handler.current_job is None
-            assert handler.current_cell is None
+        assert handler.current_job is None
+        assert handler.current_cell is None
 
     def test_in_progress_does_not_clear_job(self):
         """IN_PROGRESS should not clear the current job."""
@@ -351,6 +348,32 @@ class TestTrigger:
         assert published[0].status == OrderStatus.FAILED
 
 
+# ---------------------------------------------------------------------------
+# assign_jobs() tests
+# ---------------------------------------------------------------------------
+
+class TestAssignJobs:
+    def test_assign_jobs_queues_in_order_and_triggers_once(self):
+        handler = make_robot_handler(num_cells=3)
+        handler.trigger = MagicMock()
+        jobs = [make_job(operation=JobOperation.PICKUP), make_job(operation=JobOperation.DELIVERY)]
+
+        handler.assign_jobs(jobs)
+
+        assert handler.job_queue == jobs
+        handler.trigger.assert_called_once()
+
+    def test_assign_jobs_starts_first_job(self):
+        handler = make_robot_handler(num_cells=3)
+        first, second = make_job(operation=JobOperation.PICKUP), make_job(operation=JobOperation.DELIVERY)
+
+        handler.assign_jobs([first, second])
+
+        handler.send_job.assert_called_once()
+        assert handler.send_job.call_args[0][0] is first
+        assert handler.job_queue == [second]
+
+
 # ---------------------------------------------------------------------------
 # clear_error() tests
 # ---------------------------------------------------------------------------
@@ -381,3 +404,137 @@ class TestClearError:
         handler = make_robot_handler(num_cells=2, action_status=RobotActionStatus.OPERATING)
         result = handler.clear_error()
         assert result is False
+
+
+# ---------------------------------------------------------------------------
+# Reconnect wakeup tests
+# ---------------------------------------------------------------------------
+
+class TestReconnectWakeup:
+    def test_close_event_with_protocol_sets_wakeup(self):
+        """roslibpy emits 'close' with the protocol; the listener must accept it and wake the loop."""
+        from fleet_gateway.robot import RobotConnector
+
+        with (
+            patch("fleet_gateway.robot.Ros.connect"),
+            patch("fleet_gateway.robot.RobotConnector._reconnect_loop"),
+        ):
+            connector = RobotConnector("robot1", "127.0.0.1", 9090, MagicMock())
+            connector._reconnect_thread.join()
+
+        connector.emit('close', MagicMock())
+
+        assert connector._reconnect_wakeup.is_set()
+
+    def test_connection_event_with_protocol_is_accepted(self):
+        from fleet_gateway.robot import RobotConnector
+
+        with (
+            patch("fleet_gateway.robot.Ros.connect"),
+            patch("fleet_gateway.robot.RobotConnector._reconnect_loop"),
+        ):
+            connector = RobotConnector("robot1", "127.0.0.1", 9090, MagicMock())
+            connector._reconnect_thread.join()
+
+        connector.emit('connection', MagicMock())
+
+        assert not connector._reconnect_wakeup.is_set()
+
+
+# ---------------------------------------------------------------------------
+# _reconnect_loop tests
+# ---------------------------------------------------------------------------
+
+def make_reconnect_connector(stop_after_waits, connected=False):
+    """RobotConnector with only the reconnect-loop state; waits are recorded and
+    the loop is stopped once stop_after_waits waits have happened."""
+    import threading
+    from fleet_gateway.robot import RobotConnector
+
+    connector = RobotConnector.__new__(RobotConnector)
+    connector.name = "robot1"
+    connector._should_reconnect = True
+    connector._reconnect_wakeup = threading.Event()
+    connector.factory = MagicMock(is_connected=connected)
+    connector._connect = MagicMock()
+    connector.close = MagicMock()
+    connector.waits = []
+
+    def wait(timeout=None):
+        connector.waits.append(timeout)
+        if len(connector.waits) >= stop_after_waits:
+            connector._should_reconnect = False
+        return False
+
+    connector._reconnect_wakeup.wait = wait
+    return connector
+
+
+class TestReconnectLoop:
+    def test_backoff_doubles_up_to_cap_while_disconnected(self):
+        connector = make_reconnect_connector(stop_after_waits=6)
+
+        with patch("fleet_gateway.robot.random.uniform", return_value=1.0):
+            connector._reconnect_loop()
+
+        assert connector.waits == [5.0, 10.0, 20.0, 40.0, 60.0, 60.0]
+        # Initial connection plus one attempt after each wait but the last
+        assert connector._connect.call_count == 6
+
+    def test_backoff_resets_once_connected(self):
+        connector = make_reconnect_connector(stop_after_waits=4)
+
+        def connect():
+            if connector._connect.call_count == 3:
+                connector.factory.is_connected = True
+
+        connector._connect.side_effect = connect
+
+        with patch("fleet_gateway.robot.random.uniform", return_value=1.0):
+            connector._reconnect_loop()
+
+        assert connector.waits == [5.0, 10.0, 5.0, 5.0]
+        assert connector._connect.call_count == 3
+
+    def test_waits_are_jittered_within_bounds(self):
+        connector = make_reconnect_connector(stop_after_waits=20, connected=True)
+
+        connector._reconnect_loop()
+
+        assert all(4.0 <= wait <= 6.0 for wait in connector.waits)
+        assert len(set(connector.waits)) > 1
+        connector._connect.assert_called_once()
+
+    def test_failed_initial_connect_is_retried(self):
+        connector = make_reconnect_connector(stop_after_waits=2)
+
+        def connect():
+            # A failed attempt also fires 'close', which must not cause an immediate retry
+            connector._reconnect_wakeup.set()
+            if connector._connect.call_count == 1:
+                raise ConnectionError("robot unreachable")
+
+        connector._connect.side_effect = connect
+
+        with patch("fleet_gateway.robot.random.uniform", return_value=1.0):
+            connector._reconnect_loop()
+
+        assert connector.waits == [5.0, 10.0]
+        assert connector._connect.call_count == 2
+        assert not connector._reconnect_wakeup.is_set()
+
+    def test_shutdown_stops_the_loop(self):
+        connector = make_reconnect_connector(stop_after_waits=100)
+
+        def wait(timeout=None):
+            connector.waits.append(timeout)
+            connector.shutdown()
+            return True
+
+        connector._reconnect_wakeup.wait = wait
+
+        connector._reconnect_loop()
+
+        assert len(connector.waits) == 1
+        connector._connect.assert_called_once()
+        connector.close.assert_called_once()
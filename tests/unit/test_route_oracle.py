@@ -0,0 +1,146 @@
+"""
+Tests for RouteOracle node decoding and caching.
+
+The Supabase RPC is stubbed at RouteOracle._post_rpc, so rows go through the
+real msgspec decoder and Node hydration.
+"""
+from __future__ import annotations
+
+import json
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from fleet_gateway.enums import NodeType
+from fleet_gateway.route_oracle import RouteOracle, _NODE_CACHE_STALE_GRACE, _NODE_CACHE_TTL, _PATH_CACHE_TTL
+
+
+@pytest.fixture
+def route_oracle():
+    ro = RouteOracle("http://localhost:54321", "key", 1)
+    yield ro
+    ro.close()
+
+
+@pytest.fixture
+def clock():
+    with patch("fleet_gateway.route_oracle.time") as mock_time:
+        mock_time.monotonic.return_value = 1000.0
+        yield mock_time
+
+
+class TestNodeRowDecoding:
+    def test_null_type_falls_back_to_waypoint(self, route_oracle):
+        body = b'[{"id": 1, "x": 0.5, "y": 1.5, "type": null, "alias": "n1", "tag_id": null, "height": null}]'
+        with patch.object(route_oracle, "_post_rpc", return_value=body):
+            nodes = route_oracle.get_nodes([1])
+
+        assert len(nodes) == 1
+        assert nodes[0].node_type == NodeType.WAYPOINT
+        assert nodes[0].alias == "n1"
+        assert nodes[0].tag_id == ""
+        assert nodes[0].height == 0.0
+
+    def test_unknown_type_falls_back_to_waypoint(self, route_oracle):
+        body = b'[{"id": 2, "x": 0.0, "y": 0.0, "type": "ramp"}, {"id": 3, "x": 0.0, "y": 0.0, "type": "shelf"}]'
+        with patch.object(route_oracle, "_post_rpc", return_value=body):
+            nodes = route_oracle.get_nodes([2, 3])
+
+        assert [node.node_type for node in nodes] == [NodeType.WAYPOINT, NodeType.SHELF]
+
+
+class TestNodeCache:
+    @pytest.fixture
+    def post_rpc(self, route_oracle):
+        def rows(fn, params):
+            return json.dumps([
+                {"id": node_id, "x": 0.0, "y": 0.0, "type": "waypoint", "alias": f"n{node_id}", "tag_id": f"tag{node_id}"}
+                for node_id in params["p_node_ids"]
+            ]).encode()
+
+        post_rpc = MagicMock(side_effect=rows)
+        with patch.object(route_oracle, "_post_rpc", post_rpc):
+            yield post_rpc
+
+    @pytest.fixture
+    def refresh_executor(self, route_oracle):
+        with patch.object(route_oracle, "_refresh_executor") as executor:
+            yield executor
+
+    def test_get_nodes_fetches_only_misses_in_requested_order(self, route_oracle, post_rpc, clock):
+        route_oracle.get_nodes([2])
+        post_rpc.reset_mock()
+
+        nodes = route_oracle.get_nodes([3, 2, 1])
+
+        assert [node.id for node in nodes] == [3, 2, 1]
+        post_rpc.assert_called_once_with("wh_get_nodes_by_ids", {"p_graph_id": 1, "p_node_ids": [3, 1]})
+
+    def test_stale_hit_is_served_and_queues_one_refresh(self, route_oracle, post_rpc, refresh_executor, clock):
+        node = route_oracle.get_node(1)
+        clock.monotonic.return_value += _NODE_CACHE_TTL + 1
+
+        assert route_oracle.get_node(1) is node
+        assert route_oracle.get_node(1) is node
+
+        post_rpc.assert_called_once()
+        refresh_executor.submit.assert_called_once_with(route_oracle._refresh_node, (1, 1))
+
+    def test_expired_node_is_refetched_inline(self, route_oracle, post_rpc, refresh_executor, clock):
+        node = route_oracle.get_node(1)
+        clock.monotonic.return_value += _NODE_CACHE_TTL + _NODE_CACHE_STALE_GRACE
+
+        refetched = route_oracle.get_node(1)
+
+        assert refetched is not node
+        assert refetched.id == 1
+        assert post_rpc.call_count == 2
+        refresh_executor.submit.assert_not_called()
+
+    def test_node_fetched_by_id_answers_tag_lookup(self, route_oracle, post_rpc, clock):
+        node = route_oracle.get_node(7)
+
+        assert route_oracle.get_node_by_tag_id("tag7") is node
+        post_rpc.assert_called_once()
+
+
+class TestPathCache:
+    @pytest.fixture
+    def rpc(self, route_oracle):
+        paths = {(1, 3): [1, 2, 3], (3, 1): [3, 2, 1], (1, 2): [1, 2], (4, 5): []}
+        rpc = MagicMock(side_effect=lambda fn, params: list(paths[(params["p_start_vid"], params["p_end_vid"])]))
+        with patch.object(route_oracle, "_rpc", rpc):
+            yield rpc
+
+    def test_hit_skips_the_rpc(self, route_oracle, rpc, clock):
+        assert route_oracle.get_shortest_path(1, 3) == [1, 2, 3]
+        clock.monotonic.return_value += _PATH_CACHE_TTL - 1
+        assert route_oracle.get_shortest_path(1, 3) == [1, 2, 3]
+
+        rpc.assert_called_once()
+
+    def test_expired_path_is_refetched(self, route_oracle, rpc, clock):
+        route_oracle.get_shortest_path(1, 3)
+        clock.monotonic.return_value += _PATH_CACHE_TTL
+        route_oracle.get_shortest_path(1, 3)
+
+        assert rpc.call_count == 2
+
+    def test_empty_path_is_not_cached(self, route_oracle, rpc, clock):
+        assert route_oracle.get_shortest_path(4, 5) == []
+        assert route_oracle.get_shortest_path(4, 5) == []
+
+        assert rpc.call_count == 2
+
+    def test_least_recently_used_path_is_evicted(self, route_oracle, rpc, clock):
+        with patch("fleet_gateway.route_oracle._PATH_CACHE_MAX_SIZE", 2):
+            route_oracle.get_shortest_path(1, 3)
+            route_oracle.get_shortest_path(3, 1)
+            route_oracle.get_shortest_path(1, 3)
+            route_oracle.get_shortest_path(1, 2)
+            rpc.reset_mock()
+
+            route_oracle.get_shortest_path(1, 3)
+            rpc.assert_not_called()
+            route_oracle.get_shortest_path(3, 1)
+            rpc.assert_called_once()
@@ -0,0 +1,48 @@
+"""
+Tests for the combined GraphQL schema's validation rules.
+"""
+from __future__ import annotations
+
+import pytest
+
+from fleet_gateway.api.schema import schema
+
+
+DEEPEST_SUPPORTED_QUERY = """
+{
+  robot(name: "robot1") {
+    cells { holding { request { pickup { targetNode { alias } } } } }
+  }
+}
+"""
+
+CYCLIC_QUERY = """
+{
+  robot(name: "robot1") {
+    cells { holding { request { pickup { request { delivery { request { pickup { uuid } } } } } } } }
+  }
+}
+"""
+
+
+@pytest.mark.asyncio
+async def test_cyclic_query_is_rejected_before_resolving():
+    # An empty context would raise in any resolver, so a depth error proves nothing ran
+    result = await schema.execute(CYCLIC_QUERY, context_value={})
+    assert result.errors
+    assert "exceeds maximum operation depth" in result.errors[0].message
+
+
+@pytest.mark.asyncio
+async def test_deepest_supported_query_is_not_depth_limited():
+    # Resolvers fail on the empty context; only the absence of a depth error matters here
+    result = await schema.execute(DEEPEST_SUPPORTED_QUERY, context_value={})
+    assert not any("maximum operation depth" in error.message for error in result.errors or [])
+
+
+@pytest.mark.asyncio
+async def test_cached_validation_still_rejects_repeated_cyclic_query():
+    for _ in range(2):
+        result = await schema.execute(CYCLIC_QUERY, context_value={})
+        assert result.errors
+        assert "exceeds maximum operation depth" in result.errors[0].message
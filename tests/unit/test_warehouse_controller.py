@@ -9,12 +9,15 @@ from __future__ import annotations
 
 import asyncio
 import gc
+import inspect
+from dataclasses import replace
 import pytest
+import pytest_asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 from fleet_gateway.enums import OrderStatus, JobOperation, NodeType
-from fleet_gateway.api.types import Job, Node
+from fleet_gateway.api.types import Job, JobOrderResult, Node, Request
 
 
 # ---------------------------------------------------------------------------
@@ -34,10 +37,22 @@ def make_job():
     )
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def cancel_leftover_tasks():
+    """Cancel tasks a test left running, such as the controller's job updater."""
+    yield
+    current = asyncio.current_task()
+    tasks = [task for task in asyncio.all_tasks() if task is not current and not task.done()]
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 @pytest.fixture
 def mock_fleet_handler():
     fh = MagicMock()
     fh.get_robot.return_value = MagicMock()
+    fh.has_robot.return_value = True
     return fh
 
 
@@ -45,6 +60,8 @@ def mock_fleet_handler():
 def mock_order_store():
     os = AsyncMock()
     os.set_job.return_value = True
+    os.set_jobs.side_effect = lambda jobs: [True] * len(jobs)
+    os.set_jobs_and_requests.side_effect = lambda jobs, requests: [True] * (len(jobs) + len(requests))
     os.set_request.return_value = True
     return os
 
@@ -60,6 +77,74 @@ def mock_route_oracle():
     return ro
 
 
+def track_set_jobs(order_store) -> asyncio.Event:
+    """Return an Event that is set once order_store.set_jobs has been awaited."""
+    written = asyncio.Event()
+
+    async def set_jobs(jobs):
+        written.set()
+        return [True] * len(jobs)
+
+    order_store.set_jobs.side_effect = set_jobs
+    return written
+
+
+async def wait_until(predicate, timeout=0.5):
+    """Yield to the event loop until predicate() holds, failing after timeout seconds."""
+    async def poll():
+        while not predicate():
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(poll(), timeout)
+
+
+def stub_nodes_by_id(route_oracle):
+    """Make route_oracle.get_nodes return one SHELF node per requested id, in order."""
+    route_oracle.get_nodes.side_effect = lambda ids: [
+        Node(id=i, alias=f"n{i}", tag_id=f"t{i}", x=0.0, y=0.0, height=0.0, node_type=NodeType.SHELF)
+        for i in ids
+    ]
+
+
+def make_request_order(pickup, delivery, robot_name="robot1"):
+    """RequestOrderInput stand-in: int nodes fill request_id, str nodes fill request_alias."""
+    from fleet_gateway.api.types import RequestAliasInput, RequestIDInput, RequestOrderInput
+
+    request_order = MagicMock(spec=RequestOrderInput)
+    request_order.robot_name = robot_name
+    request_order.request_id = None
+    request_order.request_alias = None
+    if isinstance(pickup, int):
+        request_order.request_id = MagicMock(spec=RequestIDInput)
+        request_order.request_id.pickup_node_id = pickup
+        request_order.request_id.delivery_node_id = delivery
+    else:
+        request_order.request_alias = MagicMock(spec=RequestAliasInput)
+        request_order.request_alias.pickup_node_alias = pickup
+        request_order.request_alias.delivery_node_alias = delivery
+    return request_order
+
+
+def make_warehouse_order(request_node_ids, route_node_ids, robot_name="robot1"):
+    """WarehouseOrderInput stand-in: (pickup, delivery) id pairs and one robot's route over node ids."""
+    from fleet_gateway.api.types import AssignmentInput, RequestIDInput, WarehouseOrderInput
+
+    assignment = MagicMock(spec=AssignmentInput)
+    assignment.robot_name = robot_name
+    assignment.route_node_ids = route_node_ids
+    assignment.route_node_aliases = None
+    request_ids = []
+    for pickup, delivery in request_node_ids:
+        request_id = MagicMock(spec=RequestIDInput)
+        request_id.pickup_node_id, request_id.delivery_node_id = pickup, delivery
+        request_ids.append(request_id)
+    order = MagicMock(spec=WarehouseOrderInput)
+    order.request_ids = request_ids
+    order.request_aliases = None
+    order.assignments = [assignment]
+    return order
+
+
 # ---------------------------------------------------------------------------
 # GC bug test
 # ---------------------------------------------------------------------------
@@ -93,14 +178,6 @@ class TestJobUpdaterTaskGCBug:
         )
         assert not task_attrs[0].done()
 
-        for task in asyncio.all_tasks():
-            if not task.done() and task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
-
     @pytest.mark.asyncio
     async def test_task_survives_and_processes_job(self, mock_fleet_handler, mock_order_store, mock_route_oracle):
         """
@@ -110,6 +187,7 @@ class TestJobUpdaterTaskGCBug:
         """
         from fleet_gateway.warehouse_controller import WarehouseController
 
+        written = track_set_jobs(mock_order_store)
         queue = asyncio.Queue()
         wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
 
@@ -119,20 +197,64 @@ class TestJobUpdaterTaskGCBug:
         job = make_job()
         queue.put_nowait(job)
 
-        # Allow the event loop to process the queue item
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)  # two ticks to be safe
+        await asyncio.wait_for(written.wait(), timeout=0.5)
+
+        mock_order_store.set_jobs.assert_called_once_with([job])
+
+    @pytest.mark.asyncio
+    async def test_queued_jobs_flushed_in_one_batch(self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        """Jobs already waiting on the queue are drained into a single set_jobs call."""
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        written = track_set_jobs(mock_order_store)
+        queue = asyncio.Queue()
+        jobs = [make_job() for _ in range(3)]
+        for job in jobs:
+            queue.put_nowait(job)
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        await asyncio.wait_for(written.wait(), timeout=0.5)
+
+        mock_order_store.set_jobs.assert_called_once_with(jobs)
+
+    @pytest.mark.asyncio
+    async def test_repeated_updates_for_a_job_are_coalesced(self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        """Several queued updates for one job are written once, with the latest state."""
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        written = track_set_jobs(mock_order_store)
+        queue = asyncio.Queue()
+        job, other = make_job(), make_job()
+        completed = replace(job, status=OrderStatus.COMPLETED)
+        for update in (job, other, completed):
+            queue.put_nowait(update)
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        await asyncio.wait_for(written.wait(), timeout=0.5)
+
+        mock_order_store.set_jobs.assert_called_once_with([completed, other])
+
+    @pytest.mark.asyncio
+    async def test_unchanged_status_is_not_rewritten(self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        """A job re-queued with the status already written is skipped; a new status is written."""
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        queue = asyncio.Queue()
+        job = make_job()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
 
-        mock_order_store.set_job.assert_called_once_with(job)
+        queue.put_nowait(job)
+        await wait_until(lambda: mock_order_store.set_jobs.call_count == 1)
+        queue.put_nowait(job)
+        # The skipped update is taken off the queue without awaiting anything else
+        await wait_until(queue.empty)
+        assert mock_order_store.set_jobs.call_count == 1
 
-        # Cleanup
-        for task in asyncio.all_tasks():
-            if not task.done() and task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
+        completed = replace(job, status=OrderStatus.COMPLETED)
+        queue.put_nowait(completed)
+        await wait_until(lambda: mock_order_store.set_jobs.call_count == 2)
+        mock_order_store.set_jobs.assert_called_with([completed])
+        assert job.uuid not in wc._last_status
 
     @pytest.mark.asyncio
     async def test_task_gone_after_gc(self, mock_fleet_handler, mock_order_store, mock_route_oracle):
@@ -149,44 +271,73 @@ class TestJobUpdaterTaskGCBug:
         """
         from fleet_gateway.warehouse_controller import WarehouseController
 
+        written = track_set_jobs(mock_order_store)
         queue = asyncio.Queue()
         wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
 
         await asyncio.sleep(0)
 
-        # Force full garbage collection
-        gc.collect()
-        gc.collect()
-        gc.collect()
+        # Force a full (generation 2) garbage collection
+        gc.collect(2)
 
         job = make_job()
         queue.put_nowait(job)
 
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
+        try:
+            await asyncio.wait_for(written.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            pass
 
         # If the task survived GC (CPython typical case), set_job was called
         # If not, the job silently goes nowhere — the bug manifests
-        call_count = mock_order_store.set_job.call_count
+        call_count = mock_order_store.set_jobs.call_count
         assert call_count == 1, (
-            f"Expected set_job to be called once (task alive after GC), "
+            f"Expected set_jobs to be called once (task alive after GC), "
             f"but was called {call_count} time(s). "
             f"0 calls = task was GC'd (bug reproduced)."
         )
 
-        for task in asyncio.all_tasks():
-            if not task.done() and task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
-
 
 # ---------------------------------------------------------------------------
 # Bug: Job() / Request() positional-arg constructor mismatch
 # ---------------------------------------------------------------------------
 
+_NODE = Node(id=1, alias=None, tag_id=None, x=0.0, y=0.0, height=0.0,
+             node_type=NodeType.WAYPOINT)
+
+
+@pytest.mark.parametrize("cls, args, kwargs", [
+    pytest.param(
+        Job,
+        (uuid4(), OrderStatus.QUEUING, JobOperation.TRAVEL, _NODE, None, "robot1"),
+        dict(uuid=uuid4(), status=OrderStatus.QUEUING, operation=JobOperation.TRAVEL,
+             target_node=_NODE, request_uuid=None, handling_robot_name="robot1"),
+        id="Job",
+    ),
+    pytest.param(
+        Request,
+        (uuid4(), uuid4(), uuid4(), "robot1"),
+        dict(uuid=uuid4(), pickup_uuid=uuid4(), delivery_uuid=uuid4(),
+             handling_robot_name="robot1"),
+        id="Request",
+    ),
+    pytest.param(
+        JobOrderResult,
+        (False, "msg", None),
+        dict(success=False, message="msg", job=None),
+        id="JobOrderResult",
+    ),
+])
+def test_strawberry_type_init_is_keyword_only(cls, args, kwargs):
+    """@strawberry.type generates a keyword-only __init__: positional args raise TypeError."""
+    kinds = {p.kind for p in inspect.signature(cls).parameters.values()}
+    assert inspect.Parameter.KEYWORD_ONLY in kinds
+    assert inspect.Parameter.POSITIONAL_OR_KEYWORD not in kinds
+    with pytest.raises(TypeError):
+        cls(*args)
+    assert cls(**kwargs) is not None
+
+
 class TestJobConstructorBug:
     """
     BUG: @strawberry.type generates keyword-only __init__ (note the leading `*`).
@@ -196,56 +347,6 @@ class TestJobConstructorBug:
     All mutations (send_job_order, send_request_order) are broken.
     """
 
-    def test_job_init_is_keyword_only(self):
-        """Confirm that Job.__init__ rejects positional arguments."""
-        import inspect
-        from fleet_gateway.api.types import Job
-        sig = inspect.signature(Job)
-        params = list(sig.parameters.values())
-        # A keyword-only parameter has kind == KEYWORD_ONLY
-        # (the `*` in the signature makes all params keyword-only)
-        kinds = {p.kind for p in params}
-        assert inspect.Parameter.KEYWORD_ONLY in kinds, \
-            "Job.__init__ has no keyword-only params — unexpected"
-        assert inspect.Parameter.POSITIONAL_OR_KEYWORD not in kinds, \
-            "Job.__init__ still accepts positional args — check strawberry version"
-
-    def test_positional_job_construction_raises(self):
-        """warehouse_controller.py uses positional args → TypeError."""
-        from fleet_gateway.api.types import Job, Node
-        from uuid import uuid4
-        node = Node(id=1, alias=None, tag_id=None, x=0.0, y=0.0, height=0.0,
-                    node_type=NodeType.WAYPOINT)
-        with pytest.raises(TypeError):
-            # This is exactly what warehouse_controller.py:62 does
-            Job(uuid4(), OrderStatus.QUEUING, JobOperation.TRAVEL, node, None, "robot1")
-
-    def test_keyword_job_construction_succeeds(self):
-        """Keyword arguments must work — this is the correct form."""
-        from fleet_gateway.api.types import Job, Node
-        from uuid import uuid4
-        node = Node(id=1, alias=None, tag_id=None, x=0.0, y=0.0, height=0.0,
-                    node_type=NodeType.WAYPOINT)
-        job = Job(uuid=uuid4(), status=OrderStatus.QUEUING, operation=JobOperation.TRAVEL,
-                  target_node=node, request_uuid=None, handling_robot_name="robot1")
-        assert job is not None
-
-    def test_request_init_is_keyword_only(self):
-        """Confirm that Request.__init__ also rejects positional arguments."""
-        import inspect
-        from fleet_gateway.api.types import Request
-        sig = inspect.signature(Request)
-        params = list(sig.parameters.values())
-        kinds = {p.kind for p in params}
-        assert inspect.Parameter.KEYWORD_ONLY in kinds
-
-    def test_positional_request_construction_raises(self):
-        """warehouse_controller.py:89 uses positional args → TypeError."""
-        from fleet_gateway.api.types import Request
-        from uuid import uuid4
-        with pytest.raises(TypeError):
-            Request(uuid4(), uuid4(), uuid4(), "robot1")
-
     @pytest.mark.asyncio
     async def test_accept_job_order_succeeds_with_keyword_args(
             self, mock_fleet_handler, mock_order_store, mock_route_oracle):
@@ -267,44 +368,24 @@ class TestJobConstructorBug:
         mock_order_store.set_job.assert_called_once()
         mock_fleet_handler.assign_job.assert_called_once()
 
-        for task in asyncio.all_tasks():
-            if not task.done() and task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
-
     @pytest.mark.asyncio
     async def test_accept_request_order_succeeds_with_keyword_args(
             self, mock_fleet_handler, mock_order_store, mock_route_oracle):
         """accept_request_order must return success now that keyword args are used."""
         from fleet_gateway.warehouse_controller import WarehouseController
-        from fleet_gateway.api.types import RequestOrderInput, RequestInput
 
+        stub_nodes_by_id(mock_route_oracle)
         queue = asyncio.Queue()
         wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
 
-        request_order = MagicMock(spec=RequestOrderInput)
-        request_order.robot_name = "robot1"
-        request_order.request = MagicMock(spec=RequestInput)
-        request_order.request.pickup_node_id = 1
-        request_order.request.delivery_node_id = 1
-
-        result = await wc.accept_request_order(request_order)
+        result = await wc.accept_request_order(make_request_order(1, 1))
 
         assert result.success is True
-        assert mock_order_store.set_job.call_count == 2
-        assert mock_order_store.set_request.call_count == 1
-        assert mock_fleet_handler.assign_job.call_count == 2
-
-        for task in asyncio.all_tasks():
-            if not task.done() and task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
+        mock_order_store.set_jobs_and_requests.assert_awaited_once()
+        mock_order_store.set_job.assert_not_called()
+        mock_order_store.set_request.assert_not_called()
+        mock_fleet_handler.assign_jobs.assert_called_once()
+        assert len(mock_fleet_handler.assign_jobs.call_args[0][1]) == 2
 
 
 # ---------------------------------------------------------------------------
@@ -318,25 +399,6 @@ class TestResultTypeConstructorBug:
     for JobOrderResult too — so even the error paths are broken.
     """
 
-    def test_job_order_result_init_is_keyword_only(self):
-        import inspect
-        from fleet_gateway.api.types import JobOrderResult
-        sig = inspect.signature(JobOrderResult)
-        params = list(sig.parameters.values())
-        kinds = {p.kind for p in params}
-        assert inspect.Parameter.KEYWORD_ONLY in kinds
-        assert inspect.Parameter.POSITIONAL_OR_KEYWORD not in kinds
-
-    def test_positional_job_order_result_raises(self):
-        from fleet_gateway.api.types import JobOrderResult
-        with pytest.raises(TypeError):
-            JobOrderResult(False, "msg", None)
-
-    def test_keyword_job_order_result_succeeds(self):
-        from fleet_gateway.api.types import JobOrderResult
-        r = JobOrderResult(success=False, message="msg", job=None)
-        assert r.success is False
-
     @pytest.mark.asyncio
     async def test_error_path_returns_failure_gracefully(
             self, mock_fleet_handler, mock_order_store, mock_route_oracle):
@@ -359,10 +421,208 @@ class TestResultTypeConstructorBug:
         assert result.success is False
         assert result.job is None
 
-        for task in asyncio.all_tasks():
-            if not task.done() and task is not asyncio.current_task():
-                task.cancel()
-                try:
-                    await task
-                except (asyncio.CancelledError, Exception):
-                    pass
+
+# ---------------------------------------------------------------------------
+# accept_request_order
+# ---------------------------------------------------------------------------
+
+class TestAcceptRequestOrder:
+    @pytest.mark.asyncio
+    async def test_failed_delivery_write_reports_and_does_not_assign(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        stub_nodes_by_id(mock_route_oracle)
+        mock_order_store.set_jobs_and_requests.side_effect = None
+        mock_order_store.set_jobs_and_requests.return_value = [True, False, True]
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        result = await wc.accept_request_order(make_request_order(1, 2))
+
+        assert result.success is False
+        assert result.message == "Unable to store delivery job"
+        jobs, [request] = mock_order_store.set_jobs_and_requests.call_args[0]
+        assert [job.operation for job in jobs] == [JobOperation.PICKUP, JobOperation.DELIVERY]
+        assert request.pickup_uuid == jobs[0].uuid
+        mock_fleet_handler.assign_jobs.assert_not_called()
+
+
+class TestRequestOrderNodeLookup:
+    @pytest.mark.asyncio
+    async def test_same_pickup_and_delivery_node_looked_up_once(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        result = await wc.accept_request_order(make_request_order("n1", "n1"))
+
+        assert result.success is True
+        mock_route_oracle.get_nodes.assert_called_once_with(["n1"])
+        jobs, _ = mock_order_store.set_jobs_and_requests.call_args[0]
+        assert jobs[0].target_node is jobs[1].target_node
+
+
+# ---------------------------------------------------------------------------
+# build_assignment_indices
+# ---------------------------------------------------------------------------
+
+class TestBuildAssignmentIndices:
+    @pytest.mark.asyncio
+    async def test_builds_both_indices_in_one_call(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+        from fleet_gateway.api.types import AssignmentInput
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        a1 = MagicMock(spec=AssignmentInput)
+        a1.robot_name = "robot1"
+        a1.route_node_ids = [10, 11]
+        a1.route_node_aliases = None
+        a2 = MagicMock(spec=AssignmentInput)
+        a2.robot_name = "robot2"
+        a2.route_node_ids = [20]
+        a2.route_node_aliases = None
+
+        node_to_robot, robot_to_node_indices = wc.build_assignment_indices([a1, a2])
+
+        assert node_to_robot == {10: "robot1", 11: "robot1", 20: "robot2"}
+        assert robot_to_node_indices == {"robot1": {10: 0, 11: 1}, "robot2": {20: 0}}
+
+
+# ---------------------------------------------------------------------------
+# accept_warehouse_order
+# ---------------------------------------------------------------------------
+
+class TestAcceptWarehouseOrder:
+    @pytest.mark.asyncio
+    async def test_stores_every_request_then_assigns_routes(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        stub_nodes_by_id(mock_route_oracle)
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        result = await wc.accept_warehouse_order(make_warehouse_order([(1, 2), (3, 4)], [1, 3, 2, 4]))
+
+        assert result.success is True
+        assert len(result.requests) == 2
+        mock_route_oracle.get_nodes.assert_called_once_with([1, 2, 3, 4])
+        jobs, requests = mock_order_store.set_jobs_and_requests.call_args[0]
+        mock_order_store.set_jobs_and_requests.assert_awaited_once()
+        assert len(jobs) == 4
+        assert requests == result.requests
+        mock_order_store.set_job.assert_not_called()
+        mock_order_store.set_request.assert_not_called()
+        mock_fleet_handler.assign_jobs.assert_called_once()
+        robot, route = mock_fleet_handler.assign_jobs.call_args[0]
+        assert robot == "robot1"
+        assert [job.target_node.id for job in route] == [1, 3, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_assign(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        stub_nodes_by_id(mock_route_oracle)
+        mock_order_store.set_jobs_and_requests.side_effect = None
+        mock_order_store.set_jobs_and_requests.return_value = [True, True, False]
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        result = await wc.accept_warehouse_order(make_warehouse_order([(1, 2)], [1, 2]))
+
+        assert result.success is False
+        mock_fleet_handler.assign_jobs.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Bulk cancellation
+# ---------------------------------------------------------------------------
+
+class TestCancelJobOrders:
+    @pytest.mark.asyncio
+    async def test_dequeues_live_jobs_before_one_bulk_write(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        queued, running = make_job(), make_job()
+        queued.status = OrderStatus.QUEUING
+        completed = replace(make_job(), status=OrderStatus.COMPLETED)
+        mock_order_store.get_jobs_by_uuids.return_value = [queued, None, running, completed]
+
+        events = []
+        mock_fleet_handler.remove_queued_job.side_effect = lambda robot, uuid: events.append(("dequeue", uuid))
+
+        async def set_jobs(jobs):
+            events.append(("write", [(job.uuid, job.status) for job in jobs]))
+            return [True] * len(jobs)
+
+        mock_order_store.set_jobs.side_effect = set_jobs
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        uuids = [queued.uuid, uuid4(), running.uuid, completed.uuid]
+        result = await wc.cancel_job_orders(uuids)
+
+        assert result == [queued, running, completed]
+        mock_order_store.get_jobs_by_uuids.assert_awaited_once_with(uuids)
+        mock_order_store.get_job.assert_not_called()
+        assert events == [
+            ("dequeue", queued.uuid),
+            ("dequeue", running.uuid),
+            ("write", [(queued.uuid, OrderStatus.CANCELED), (running.uuid, OrderStatus.CANCELED)]),
+        ]
+        assert completed.status == OrderStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_only_terminal_jobs_are_not_written(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+
+        failed = replace(make_job(), status=OrderStatus.FAILED)
+        mock_order_store.get_jobs_by_uuids.return_value = [failed]
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        assert await wc.cancel_job_orders([failed.uuid]) == [failed]
+        mock_fleet_handler.remove_queued_job.assert_not_called()
+        mock_order_store.set_jobs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cancels_all_request_jobs_in_one_store_call(
+            self, mock_fleet_handler, mock_order_store, mock_route_oracle):
+        from fleet_gateway.warehouse_controller import WarehouseController
+        from fleet_gateway.api.types import Request
+
+        requests = [
+            Request(uuid=uuid4(), pickup_uuid=uuid4(), delivery_uuid=uuid4(), handling_robot_name="robot1")
+            for _ in range(2)
+        ]
+        missing = uuid4()
+        mock_order_store.get_requests_by_uuids.return_value = [requests[0], None, requests[1]]
+        mock_order_store.get_jobs_by_uuids.return_value = []
+
+        queue = asyncio.Queue()
+        wc = WarehouseController(queue, mock_fleet_handler, mock_order_store, mock_route_oracle)
+
+        uuids = [requests[0].uuid, missing, requests[1].uuid]
+        result = await wc.cancel_request_orders(uuids)
+
+        assert result == requests
+        mock_order_store.get_requests_by_uuids.assert_awaited_once_with(uuids)
+        mock_order_store.get_request.assert_not_called()
+        mock_order_store.get_jobs_by_uuids.assert_awaited_once_with([
+            requests[0].pickup_uuid, requests[0].delivery_uuid,
+            requests[1].pickup_uuid, requests[1].delivery_uuid,
+        ])